@@ -47,6 +47,8 @@ class CullingService:
         keyword: str = "",
         shot_date_from: str | None = None,
         shot_date_to: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
     ) -> list[AssetItem]:
         safe_rating = max(0, min(int(min_rating), 5))
         safe_iso_min = _safe_int_or_none(iso_min)
@@ -79,7 +81,12 @@ class CullingService:
             if safe_date_to:
                 query = query.where(Asset.exif_shot_date.is_not(None), Asset.exif_shot_date <= safe_date_to)
 
-            assets = list(session.scalars(query.order_by(Asset.id.asc())).all())
+            query = query.order_by(Asset.id.asc())
+            if offset > 0:
+                query = query.offset(int(offset))
+            if limit is not None:
+                query = query.limit(max(0, int(limit)))
+            assets = list(session.scalars(query).all())
             return [
                 AssetItem(
                     id=item.id,
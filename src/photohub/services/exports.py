@@ -123,6 +123,7 @@ class ExportService:
                     preset_name = str(getattr(project.preset, "name", "") or "").strip()
             except Exception:
                 preset_name = ""
+            # Built once per batch and shared by every asset/profile below.
             watermark_context = build_watermark_context(
                 project=project,
                 preset_name=preset_name,
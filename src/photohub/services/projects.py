@@ -94,15 +94,43 @@ class ProjectService:
         self.session_factory = session_factory
         self.paths = paths
 
-    def list_projects(self) -> list[Project]:
+    def list_projects(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        name_contains: str = "",
+    ) -> list[Project]:
+        name_query = str(name_contains or "").strip().lower()
+        with self.session_factory() as session:
+            query = (
+                select(Project)
+                .options(selectinload(Project.preset), selectinload(Project.client))
+                .order_by(Project.created_at.desc(), Project.id.desc())
+            )
+            if name_query:
+                pattern = name_query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                query = query.where(func.lower(Project.name).like(f"%{pattern}%", escape="\\"))
+            if offset > 0:
+                query = query.offset(int(offset))
+            if limit is not None:
+                query = query.limit(max(0, int(limit)))
+            return list(session.scalars(query).all())
+
+    def list_recent_projects(self, limit: int = 10) -> list[Project]:
         with self.session_factory() as session:
             query = (
                 select(Project)
                 .options(selectinload(Project.preset), selectinload(Project.client))
-                .order_by(Project.created_at.desc())
+                .order_by(Project.created_at.desc(), Project.id.desc())
+                .limit(max(0, int(limit)))
             )
             return list(session.scalars(query).all())
 
+    def count_by_status(self) -> dict[str, int]:
+        with self.session_factory() as session:
+            query = select(Project.status, func.count(Project.id)).group_by(Project.status)
+            return {str(status): int(count) for status, count in session.execute(query).all()}
+
     def get_project(self, project_id: int) -> Project | None:
         with self.session_factory() as session:
             query = (
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import functools
+import math
 import re
-from datetime import datetime
+import sys
+from datetime import date, datetime
+from types import MappingProxyType
 
 ANCHOR_ORDER = (
     "top_left",
@@ -14,6 +18,8 @@ ANCHOR_ORDER = (
     "bottom_center",
     "bottom_right",
 )
+_ANCHOR_SET = frozenset(ANCHOR_ORDER)
+_VALID_LAYERS = frozenset(("text", "logo"))
 
 VARIABLE_CATALOG: list[tuple[str, str]] = [
     ("client_name", "Nom client"),
@@ -55,22 +61,38 @@ DEFAULT_LOGO_LAYER = {
     "opacity": 70,
 }
 
+# Read-only views of the canonical layer defaults; copy only when about to mutate.
+_DEFAULT_TEXT_LAYER_RO = MappingProxyType(DEFAULT_TEXT_LAYER)
+_DEFAULT_LOGO_LAYER_RO = MappingProxyType(DEFAULT_LOGO_LAYER)
+
 DEFAULT_WATERMARK_CONFIG = {
     "enabled": False,
     "version": 2,
-    "render_order": ["logo", "text"],
-    "text": dict(DEFAULT_TEXT_LAYER),
-    "logo": dict(DEFAULT_LOGO_LAYER),
+    "render_order": ("logo", "text"),
+    "text": DEFAULT_TEXT_LAYER.copy(),
+    "logo": DEFAULT_LOGO_LAYER.copy(),
 }
 
 _TOKEN_RE = re.compile(r"\{\{\s*([a-zA-Z0-9_]+)\s*\}\}")
+_HEX6_RE = re.compile(r"[0-9A-F]{6}")
+# Whitespace runs that do not cross a str.splitlines() boundary.
+_MULTISPACE_RE = re.compile(r"[^\S\n\r\v\f\x1c-\x1e\x85\u2028\u2029]{2,}")
 
 
 def normalize_opacity_percentage(value, *, default: int = 70) -> int:
-    try:
-        raw = int(float(value))
-    except Exception:
-        return max(0, min(100, int(default)))
+    # Fast path: already-normalized configs carry plain ints in 0..100.
+    if type(value) is int:
+        if 0 <= value <= 100:
+            return value
+        raw = value
+    elif type(value) is float and math.isfinite(value):
+        raw = int(value)
+    else:
+        # Strings, bools and anything exotic keep the lenient coercion.
+        try:
+            raw = int(float(value))
+        except Exception:
+            return max(0, min(100, int(default)))
     if raw < 0:
         return 0
     if raw > 100:
@@ -87,18 +109,17 @@ def normalize_watermark_config(payload: dict | None) -> dict:
         "enabled": bool(source.get("enabled", DEFAULT_WATERMARK_CONFIG["enabled"])),
         "version": 2,
         "render_order": _normalize_render_order(source.get("render_order")),
-        "text": _normalize_text_layer(source.get("text")),
+        # Legacy watermark.opacity (0..100|255) wins over the text layer value.
+        "text": _normalize_text_layer(source.get("text"), opacity_source=source if "opacity" in source else None),
         "logo": _normalize_logo_layer(source.get("logo")),
     }
 
-    # Legacy keys support: watermark.text (str), watermark.opacity (0..100|255).
+    # Legacy keys support: watermark.text (str).
     legacy_text = source.get("text")
     if isinstance(legacy_text, str):
         clean = legacy_text.strip()
         if clean:
             result["text"]["template"] = clean
-    if "opacity" in source:
-        result["text"]["opacity"] = normalize_opacity_percentage(source.get("opacity"), default=70)
 
     return result
 
@@ -118,7 +139,7 @@ def build_watermark_context(
     try:
         client = getattr(project, "client", None)
         if client is not None:
-            client_name = str(getattr(client, "name", "") or "").strip()
+            client_name = _as_stripped_str(getattr(client, "name", ""))
     except Exception:
         client_name = ""
 
@@ -132,12 +153,12 @@ def build_watermark_context(
 
     return {
         "client_name": client_name,
-        "project_name": str(getattr(project, "name", "") or "").strip(),
+        "project_name": _as_stripped_str(getattr(project, "name", "")),
         "shoot_date": shoot_date,
-        "export_date": now_value.strftime("%Y-%m-%d"),
-        "photographer_name": str(profile.get("photographer_name", "") or "").strip(),
-        "copyright_notice": str(profile.get("copyright_notice", "") or "").strip(),
-        "preset_name": str(preset_name or "").strip(),
+        "export_date": _format_export_date(now_value.date()),
+        "photographer_name": _as_stripped_str(profile.get("photographer_name", "")),
+        "copyright_notice": _as_stripped_str(profile.get("copyright_notice", "")),
+        "preset_name": _as_stripped_str(preset_name),
         "rating_min": str(max(0, min(int(min_rating), 5))),
     }
 
@@ -146,28 +167,60 @@ def render_template(text: str, context: dict[str, object] | None) -> str:
     payload = str(text or "")
     mapping = context if isinstance(context, dict) else {}
 
-    def _replace(match: re.Match[str]) -> str:
-        key = match.group(1)
-        value = mapping.get(key, "")
-        return str(value or "")
+    rendered = _MULTISPACE_RE.sub(" ", _compile_renderer(payload)(mapping))
+    return "\n".join(filter(None, map(str.strip, rendered.splitlines())))
+
+
+@functools.lru_cache(maxsize=8)
+def _format_export_date(day: date) -> str:
+    return day.strftime("%Y-%m-%d")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_renderer(template: str):
+    """Specialize a template into a mapping -> str function, once per template."""
+    # Even slots are literals, odd slots are token names captured by _TOKEN_RE.
+    parts = _TOKEN_RE.split(template)
+    if len(parts) == 1:
+        return lambda mapping: template
+    if len(parts) == 3:
+        head, key, tail = parts
+        return lambda mapping: head + str(mapping.get(key, "") or "") + tail
+    literals = tuple(parts[0::2])
+    keys = tuple(parts[1::2])
+    last = literals[-1]
+
+    def _render(mapping) -> str:
+        out = []
+        for literal, key in zip(literals, keys):
+            out.append(literal)
+            out.append(str(mapping.get(key, "") or ""))
+        out.append(last)
+        return "".join(out)
 
-    rendered = _TOKEN_RE.sub(_replace, payload)
-    lines: list[str] = []
-    for line in rendered.splitlines():
-        normalized = re.sub(r"\s{2,}", " ", line).strip()
-        lines.append(normalized)
-    return "\n".join(line for line in lines if line).strip()
+    return _render
 
 
 def summarize_watermark_config(config: dict | None) -> str:
-    wm = normalize_watermark_config(config if isinstance(config, dict) else {})
-    if not wm.get("enabled", False):
+    source = config if isinstance(config, dict) else {}
+    if isinstance(source.get("watermark"), dict):
+        source = source["watermark"]
+    # Only a few flags are displayed: read them from the raw payload instead of
+    # running the full color/anchor/float normalization.
+    if not source.get("enabled", DEFAULT_WATERMARK_CONFIG["enabled"]):
         return "Desactive"
-    text_on = bool(wm.get("text", {}).get("enabled", False))
-    logo_on = bool(wm.get("logo", {}).get("enabled", False))
+    text_on = _layer_enabled(source.get("text"), _DEFAULT_TEXT_LAYER_RO)
+    logo_on = _layer_enabled(source.get("logo"), _DEFAULT_LOGO_LAYER_RO)
+    order = _normalize_render_order(source.get("render_order"))
     text_part = "texte on" if text_on else "texte off"
     logo_part = "logo on" if logo_on else "logo off"
-    return f"{text_part} | {logo_part} | ordre: {'>'.join(wm.get('render_order', []))}"
+    return f"{text_part} | {logo_part} | ordre: {'>'.join(order)}"
+
+
+def _layer_enabled(value, defaults) -> bool:
+    if not isinstance(value, dict):
+        return bool(defaults["enabled"])
+    return bool(value.get("enabled", defaults["enabled"]))
 
 
 def _normalize_render_order(value) -> list[str]:
@@ -175,9 +228,10 @@ def _normalize_render_order(value) -> list[str]:
         return list(DEFAULT_WATERMARK_CONFIG["render_order"])
     out: list[str] = []
     for item in value:
-        name = str(item or "").strip().lower()
-        if name not in {"text", "logo"}:
+        name = _as_stripped_str(item).lower()
+        if name not in _VALID_LAYERS:
             continue
+        name = sys.intern(name)
         if name in out:
             continue
         out.append(name)
@@ -187,62 +241,73 @@ def _normalize_render_order(value) -> list[str]:
     return out
 
 
-def _normalize_text_layer(value) -> dict:
+def _normalize_text_layer(value, *, opacity_source: dict | None = None) -> dict:
     source = value if isinstance(value, dict) else {}
-    out = dict(DEFAULT_TEXT_LAYER)
+    if opacity_source is None:
+        opacity_source = source
+    out = _DEFAULT_TEXT_LAYER_RO.copy()
     out["enabled"] = bool(source.get("enabled", out["enabled"]))
-    out["template"] = str(source.get("template", out["template"]) or "").strip()
-    out["font_family"] = str(source.get("font_family", out["font_family"]) or "").strip() or "Sans"
+    out["template"] = _as_stripped_str(source.get("template", out["template"]))
+    out["font_family"] = _as_stripped_str(source.get("font_family", out["font_family"])) or "Sans"
     out["bold"] = bool(source.get("bold", out["bold"]))
     out["italic"] = bool(source.get("italic", out["italic"]))
     out["color_hex"] = _normalize_hex(source.get("color_hex"), fallback=out["color_hex"])
     out["stroke_enabled"] = bool(source.get("stroke_enabled", out["stroke_enabled"]))
     out["stroke_color_hex"] = _normalize_hex(source.get("stroke_color_hex"), fallback=out["stroke_color_hex"])
-    out["stroke_width_px"] = _to_int(source.get("stroke_width_px"), default=out["stroke_width_px"], low=0, high=24)
+    out["stroke_width_px"] = _to_int(source.get("stroke_width_px"), out["stroke_width_px"], 0, 24)
     out["anchor"] = _normalize_anchor(source.get("anchor"), out["anchor"])
-    out["offset_x_pct"] = _to_float(source.get("offset_x_pct"), out["offset_x_pct"], low=-100.0, high=100.0)
-    out["offset_y_pct"] = _to_float(source.get("offset_y_pct"), out["offset_y_pct"], low=-100.0, high=100.0)
-    out["size_pct"] = _to_float(source.get("size_pct"), out["size_pct"], low=0.5, high=80.0)
-    out["angle_deg"] = _to_float(source.get("angle_deg"), out["angle_deg"], low=-180.0, high=180.0)
-    out["opacity"] = normalize_opacity_percentage(source.get("opacity"), default=out["opacity"])
+    out["offset_x_pct"] = _to_float(source.get("offset_x_pct"), out["offset_x_pct"], -100.0, 100.0)
+    out["offset_y_pct"] = _to_float(source.get("offset_y_pct"), out["offset_y_pct"], -100.0, 100.0)
+    out["size_pct"] = _to_float(source.get("size_pct"), out["size_pct"], 0.5, 80.0)
+    out["angle_deg"] = _to_float(source.get("angle_deg"), out["angle_deg"], -180.0, 180.0)
+    out["opacity"] = normalize_opacity_percentage(opacity_source.get("opacity"), default=out["opacity"])
     return out
 
 
 def _normalize_logo_layer(value) -> dict:
     source = value if isinstance(value, dict) else {}
-    out = dict(DEFAULT_LOGO_LAYER)
+    out = _DEFAULT_LOGO_LAYER_RO.copy()
     out["enabled"] = bool(source.get("enabled", out["enabled"]))
-    out["asset_rel_path"] = str(source.get("asset_rel_path", out["asset_rel_path"]) or "").strip()
+    out["asset_rel_path"] = _as_stripped_str(source.get("asset_rel_path", out["asset_rel_path"]))
     out["anchor"] = _normalize_anchor(source.get("anchor"), out["anchor"])
-    out["offset_x_pct"] = _to_float(source.get("offset_x_pct"), out["offset_x_pct"], low=-100.0, high=100.0)
-    out["offset_y_pct"] = _to_float(source.get("offset_y_pct"), out["offset_y_pct"], low=-100.0, high=100.0)
-    out["size_pct"] = _to_float(source.get("size_pct"), out["size_pct"], low=0.5, high=100.0)
-    out["angle_deg"] = _to_float(source.get("angle_deg"), out["angle_deg"], low=-180.0, high=180.0)
+    out["offset_x_pct"] = _to_float(source.get("offset_x_pct"), out["offset_x_pct"], -100.0, 100.0)
+    out["offset_y_pct"] = _to_float(source.get("offset_y_pct"), out["offset_y_pct"], -100.0, 100.0)
+    out["size_pct"] = _to_float(source.get("size_pct"), out["size_pct"], 0.5, 100.0)
+    out["angle_deg"] = _to_float(source.get("angle_deg"), out["angle_deg"], -180.0, 180.0)
     out["opacity"] = normalize_opacity_percentage(source.get("opacity"), default=out["opacity"])
     return out
 
 
+def _as_stripped_str(value, default: str = "") -> str:
+    if type(value) is str:
+        return value.strip()
+    if not value:
+        return default
+    return str(value).strip()
+
+
 def _normalize_anchor(value, fallback: str) -> str:
-    token = str(value or "").strip().lower()
-    if token in ANCHOR_ORDER:
-        return token
+    token = _as_stripped_str(value).lower()
+    if token in _ANCHOR_SET:
+        # Hand back the shared interned constant so later comparisons hit identity.
+        return sys.intern(token)
     return fallback
 
 
 def _normalize_hex(value, *, fallback: str) -> str:
-    raw = str(value or "").strip().upper()
+    raw = _as_stripped_str(value).upper()
     if not raw:
         return fallback
     if not raw.startswith("#"):
-        raw = f"#{raw}"
-    if len(raw) != 7:
-        return fallback
-    if not all(ch in "0123456789ABCDEF" for ch in raw[1:]):
+        raw = "#" + raw
+    if len(raw) != 7 or _HEX6_RE.fullmatch(raw, 1) is None:
         return fallback
     return raw
 
 
-def _to_int(value, *, default: int, low: int, high: int) -> int:
+def _to_int(value, default: int, low: int, high: int) -> int:
+    if type(value) is int and low <= value <= high:
+        return value
     try:
         parsed = int(float(value))
     except Exception:
@@ -250,7 +315,9 @@ def _to_int(value, *, default: int, low: int, high: int) -> int:
     return max(low, min(high, parsed))
 
 
-def _to_float(value, default: float, *, low: float, high: float) -> float:
+def _to_float(value, default: float, low: float, high: float) -> float:
+    if type(value) is float and low <= value <= high:
+        return value
     try:
         parsed = float(value)
     except Exception:
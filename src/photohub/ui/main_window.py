@@ -1,20 +1,22 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
+import time
+from collections import Counter
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
-from PySide6.QtCore import QDate, QEvent, QObject, QSize, QThread, QTimer, Qt, Signal
-from PySide6.QtGui import QColor, QIcon, QKeySequence, QPixmap, QShortcut
+from PySide6.QtCore import QDate, QEvent, QObject, QSignalBlocker, QSize, QThread, QThreadPool, QTimer, Qt, Signal
+from PySide6.QtGui import QColor, QIcon, QImage, QImageIOHandler, QImageReader, QKeySequence, QPixmap, QPixmapCache, QShortcut
 from PySide6.QtWidgets import (
+    QApplication,
     QCheckBox,
-    QColorDialog,
     QComboBox,
     QDateEdit,
-    QDialog,
     QDoubleSpinBox,
     QFileDialog,
     QFrame,
@@ -44,7 +46,7 @@ from PySide6.QtWidgets import (
 )
 
 from ..config import compute_app_data_dir_from_root, normalize_accent_color, resolve_app_paths
-from ..preset_defaults import default_preset_config
+from ..preset_defaults import DEFAULT_PRESET_CONFIG
 from ..services import (
     CullingService,
     EditService,
@@ -61,7 +63,6 @@ from ..services import (
 )
 from ..services.edits import DEFAULT_EDIT_SETTINGS
 from ..services.watermarks import normalize_watermark_config, summarize_watermark_config
-from .watermark_editor import WatermarkEditorDialog
 
 FIF = None
 FluentPushButton = None
@@ -80,8 +81,10 @@ QFLUENT_AVAILABLE = False
 QFLUENT_DISABLE_REASON = ""
 _QFLUENT_IMPORT_ATTEMPTED = False
 NativePushButton = QPushButton
+_SEARCH_LINE_EDIT_CLS = QLineEdit
 
 
+@functools.lru_cache(maxsize=256)
 def _lighter(color_hex: str, amount: int) -> str:
     color = QColor(color_hex)
     if not color.isValid():
@@ -89,6 +92,7 @@ def _lighter(color_hex: str, amount: int) -> str:
     return color.lighter(max(100, 100 + int(amount))).name().upper()
 
 
+@functools.lru_cache(maxsize=256)
 def _darker(color_hex: str, amount: int) -> str:
     color = QColor(color_hex)
     if not color.isValid():
@@ -96,25 +100,43 @@ def _darker(color_hex: str, amount: int) -> str:
     return color.darker(max(100, 100 + int(amount))).name().upper()
 
 
+@functools.lru_cache(maxsize=256)
 def _rgba(color_hex: str, alpha: int) -> str:
-    color = QColor(color_hex)
-    if not color.isValid():
-        color = QColor("#10B981")
-    return f"rgba({color.red()}, {color.green()}, {color.blue()}, {max(0, min(255, int(alpha)))})"
+    r, g, b = _parse_hex(color_hex, "#10B981")
+    return f"rgba({r}, {g}, {b}, {max(0, min(255, int(alpha)))})"
 
 
+@functools.lru_cache(maxsize=256)
 def _blend(color_a: str, color_b: str, ratio_b: float) -> str:
-    a = QColor(color_a)
-    b = QColor(color_b)
-    if not a.isValid():
-        a = QColor("#10B981")
-    if not b.isValid():
-        b = QColor("#2D5A27")
+    ar, ag, ab = _parse_hex(color_a, "#10B981")
+    br, bg, bb = _parse_hex(color_b, "#2D5A27")
     t = max(0.0, min(1.0, float(ratio_b)))
-    r = int(round((a.red() * (1.0 - t)) + (b.red() * t)))
-    g = int(round((a.green() * (1.0 - t)) + (b.green() * t)))
-    bl = int(round((a.blue() * (1.0 - t)) + (b.blue() * t)))
-    return QColor(r, g, bl).name().upper()
+    r = int(round((ar * (1.0 - t)) + (br * t)))
+    g = int(round((ag * (1.0 - t)) + (bg * t)))
+    bl = int(round((ab * (1.0 - t)) + (bb * t)))
+    return _format_hex(r, g, bl)
+
+
+def _parse_hex(color_hex: str, fallback: str) -> tuple[int, int, int]:
+    # Theme colors are normalized "#RRGGBB"; only other spellings go through QColor.
+    if len(color_hex) == 7 and color_hex[0] == "#":
+        try:
+            return int(color_hex[1:3], 16), int(color_hex[3:5], 16), int(color_hex[5:7], 16)
+        except ValueError:
+            pass
+    color = QColor(color_hex)
+    if not color.isValid():
+        color = QColor(fallback)
+    return color.red(), color.green(), color.blue()
+
+
+def _format_hex(r: int, g: int, b: int) -> str:
+    return "#%02X%02X%02X" % (r, g, b)
+
+
+def _reset_color_caches() -> None:
+    for helper in (_lighter, _darker, _rgba, _blend):
+        helper.cache_clear()
 
 
 def _reset_fluent_state() -> None:
@@ -122,6 +144,7 @@ def _reset_fluent_state() -> None:
     global FluentLineEdit, FluentComboBox, FluentSpinBox, FluentCheckBox
     global FluentPlainTextEdit, FluentTableWidget
     global FluentThemeEnum, fluent_set_theme, fluent_set_theme_color, QFLUENT_AVAILABLE
+    global _SEARCH_LINE_EDIT_CLS
     FIF = None
     FluentPushButton = None
     FluentPrimaryPushButton = None
@@ -136,6 +159,8 @@ def _reset_fluent_state() -> None:
     fluent_set_theme = None
     fluent_set_theme_color = None
     QFLUENT_AVAILABLE = False
+    _SEARCH_LINE_EDIT_CLS = QLineEdit
+    _load_fluent_icon.cache_clear()
 
 
 def _disable_fluent(reason: str = "") -> None:
@@ -149,11 +174,13 @@ def _disable_fluent(reason: str = "") -> None:
 def _detect_qt_binding(*widget_classes) -> str:
     bindings = set()
     for widget_cls in widget_classes:
+        # A class derives from a single binding: the first Qt base settles it.
         for base_cls in getattr(widget_cls, "__mro__", ()):
             module_name = str(getattr(base_cls, "__module__", ""))
             root = module_name.split(".", 1)[0]
             if root in {"PyQt5", "PyQt6", "PySide2", "PySide6"}:
                 bindings.add(root)
+                break
     if not bindings:
         return "unknown"
     if bindings == {"PySide6"}:
@@ -186,7 +213,7 @@ def _ensure_fluent_loaded() -> None:
     global FluentLineEdit, FluentComboBox, FluentSpinBox, FluentCheckBox
     global FluentPlainTextEdit, FluentTableWidget
     global FluentThemeEnum, fluent_set_theme, fluent_set_theme_color
-    global QFLUENT_AVAILABLE, _QFLUENT_IMPORT_ATTEMPTED
+    global QFLUENT_AVAILABLE, _QFLUENT_IMPORT_ATTEMPTED, _SEARCH_LINE_EDIT_CLS
     if _QFLUENT_IMPORT_ATTEMPTED:
         return
     if str(os.getenv("PHOTOHUB_DISABLE_FLUENT", "")).strip().lower() in {"1", "true", "yes", "on"}:
@@ -246,6 +273,7 @@ def _ensure_fluent_loaded() -> None:
     fluent_set_theme = _fluent_set_theme
     fluent_set_theme_color = _fluent_set_theme_color
     QFLUENT_AVAILABLE = True
+    _SEARCH_LINE_EDIT_CLS = FluentSearchLineEdit
     _apply_fluent_widget_aliases()
     try:
         fluent_set_theme(FluentThemeEnum.DARK)
@@ -253,6 +281,25 @@ def _ensure_fluent_loaded() -> None:
         pass
 
 
+@functools.lru_cache(maxsize=32)
+def _load_fluent_icon(icon_name: str) -> QIcon:
+    icon_ref = getattr(FIF, icon_name, None)
+    if icon_ref is None:
+        return QIcon()
+    try:
+        icon = icon_ref.icon()
+        if isinstance(icon, QIcon):
+            return icon
+    except Exception:
+        pass
+    try:
+        if isinstance(icon_ref, QIcon):
+            return icon_ref
+    except Exception:
+        pass
+    return QIcon()
+
+
 def _new_button(text: str, *, primary: bool = False) -> QPushButton:
     # Keep one button class across the app and style primary intent via QSS.
     # This avoids qfluent primary widgets forcing a too-saturated accent fill.
@@ -264,6 +311,32 @@ def _new_button(text: str, *, primary: bool = False) -> QPushButton:
     return button
 
 
+def _new_directory_dialog(parent: QWidget, title: str) -> QFileDialog:
+    # Kept by the caller and reused, so the file-system model and the last
+    # visited folder survive between picks.
+    dialog = QFileDialog(parent, title)
+    dialog.setFileMode(QFileDialog.FileMode.Directory)
+    dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+    return dialog
+
+
+def _new_warning_box(parent: QWidget) -> QMessageBox:
+    # Kept by the caller and reused for its validation messages.
+    box = QMessageBox(parent)
+    box.setIcon(QMessageBox.Icon.Warning)
+    box.setStandardButtons(QMessageBox.StandardButton.Ok)
+    return box
+
+
+def _show_warning(owner: QWidget, title: str, text: str) -> None:
+    # The box is created on first use and kept on owner._validation_box.
+    if owner._validation_box is None:
+        owner._validation_box = _new_warning_box(owner)
+    owner._validation_box.setWindowTitle(title)
+    owner._validation_box.setText(text)
+    owner._validation_box.exec()
+
+
 def _new_table_widget(rows: int = 0, columns: int = 0) -> QTableWidget:
     # Qt QTableWidget supports (rows, columns) ctor, while Fluent TableWidget
     # expects a parent-only ctor. Normalize creation for both implementations.
@@ -288,6 +361,8 @@ class JobWorker(QObject):
         self.args = args
         self.kwargs = kwargs
         self._cancelled = False
+        self._last_emit_ns = 0
+        self._min_interval_ns = 50_000_000
 
     def cancel(self) -> None:
         self._cancelled = True
@@ -308,7 +383,25 @@ class JobWorker(QObject):
             self.finished.emit()
 
     def _emit_progress(self, done: int, total: int, detail: str = "") -> None:
-        self.progress.emit(int(done), int(total), str(detail))
+        # Cap GUI updates at ~20 Hz; the final tick is always delivered.
+        done = int(done)
+        total = int(total)
+        now = time.monotonic_ns()
+        if done < total and now - self._last_emit_ns < self._min_interval_ns:
+            return
+        self._last_emit_ns = now
+        self.progress.emit(done, total, str(detail))
+
+
+@functools.lru_cache(maxsize=1)
+def _job_thread_pool() -> QThreadPool:
+    # Long tab jobs reuse pooled threads instead of a QThread per run, and
+    # stay off the global pool that serves short fetches and preview decodes.
+    # One thread per job kind (import, culling batch, export) so none of them
+    # waits behind another.
+    pool = QThreadPool()
+    pool.setMaxThreadCount(3)
+    return pool
 
 
 @dataclass
@@ -331,11 +424,165 @@ class ExportQueueItem:
     message: str = ""
 
 
+@functools.lru_cache(maxsize=4096)
+def _iso(day: date) -> str:
+    return day.isoformat()
+
+
+@dataclass(frozen=True)
+class ProjectCardRow:
+    """Display snapshot of a project, compared between refreshes to skip card rebuilds."""
+
+    id: int
+    name: str
+    status_label: str
+    client_name: str
+    shoot_date: str
+    preset_name: str
+    root_path: str
+    search_text: str
+
+    @classmethod
+    def from_project(cls, project, status_label: str) -> "ProjectCardRow":
+        name = str(project.name)
+        client = project.client
+        return cls(
+            id=int(project.id),
+            name=name,
+            status_label=status_label,
+            client_name=client.name if client else "-",
+            shoot_date=_iso(project.shoot_date),
+            preset_name=project.preset.name if project.preset else "-",
+            root_path=str(project.root_path),
+            search_text=" ".join([name, client.name if client else "", status_label]).lower(),
+        )
+
+
+def _build_project_card_rows(projects, get_status_label: Callable[[str], str]) -> list[ProjectCardRow]:
+    labels: dict[str, str] = {}
+    rows: list[ProjectCardRow] = []
+    for project in projects:
+        label = labels.get(project.status)
+        if label is None:
+            label = labels[project.status] = get_status_label(project.status)
+        rows.append(ProjectCardRow.from_project(project, label))
+    return rows
+
+
+_PROJECT_COMBO_LIMIT = 200
+
+
+class ProjectListCache:
+    """Memoizes ``list_projects()`` for one refresh cascade.
+
+    MainWindow invalidates it whenever data may have changed (every
+    ``on_data_changed``), so tabs refreshed in the same pass share one query.
+    """
+
+    def __init__(self, project_service: ProjectService) -> None:
+        self.project_service = project_service
+        self._projects: list | None = None
+
+    def get_projects(self) -> list:
+        if self._projects is None:
+            self._projects = self.project_service.list_projects()
+        return self._projects
+
+    def prime(self, projects: list) -> None:
+        self._projects = list(projects)
+
+    def invalidate(self) -> None:
+        self._projects = None
+
+
+def _project_combo_label(project) -> str:
+    return f"{project.id} - {project.name}"
+
+
+def _fill_project_combo(
+    combo: QComboBox,
+    project_service: ProjectService,
+    name_contains: str = "",
+    limit: int | None = _PROJECT_COMBO_LIMIT,
+    projects: list | None = None,
+) -> dict[int, int]:
+    """Fill ``combo`` with projects and return its ``{project_id: index}`` map."""
+    # The listing may be bounded or filtered; the current project is kept
+    # (appended at the end) even when it falls outside that page.
+    if projects is not None and not name_contains.strip():
+        listed = projects if limit is None else projects[:limit]
+    else:
+        listed = project_service.list_projects(limit=limit, name_contains=name_contains)
+    current = combo.currentData()
+    index: dict[int, int] = {}
+    # QSignalBlocker restores the previous state, so callers that already
+    # block the combo keep it blocked.
+    with QSignalBlocker(combo):
+        combo.clear()
+        for project in listed:
+            index[int(project.id)] = combo.count()
+            combo.addItem(_project_combo_label(project), userData=project.id)
+        if current is not None:
+            idx = index.get(int(current), -1)
+            if idx < 0:
+                idx = _append_project_to_combo(combo, index, project_service, int(current))
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+    return index
+
+
+def _append_project_to_combo(
+    combo: QComboBox,
+    index: dict[int, int],
+    project_service: ProjectService,
+    project_id: int,
+) -> int:
+    project = project_service.get_project(int(project_id))
+    if project is None:
+        return -1
+    index[int(project.id)] = combo.count()
+    combo.addItem(_project_combo_label(project), userData=project.id)
+    return index[int(project.id)]
+
+
+def _select_project_in_combo(
+    combo: QComboBox,
+    index: dict[int, int],
+    project_service: ProjectService,
+    project_id: int,
+) -> None:
+    idx = index.get(int(project_id), -1)
+    if idx < 0:
+        with QSignalBlocker(combo):
+            idx = _append_project_to_combo(combo, index, project_service, int(project_id))
+    if idx >= 0:
+        combo.setCurrentIndex(idx)
+
+
+def _new_project_search_edit() -> QLineEdit:
+    edit = QLineEdit()
+    edit.setPlaceholderText("Rechercher projet...")
+    edit.setClearButtonEnabled(True)
+    edit.setMaximumWidth(200)
+    return edit
+
+
+def _new_search_debounce(parent: QObject, on_timeout: Callable[[], None]) -> QTimer:
+    # Project combo searches query the database: run one per typing burst.
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(250)
+    timer.timeout.connect(on_timeout)
+    return timer
+
+
 class DashboardTab(QWidget):
     def __init__(self, project_service: ProjectService, get_active_jobs: Callable[[], int]) -> None:
         super().__init__()
         self.project_service = project_service
         self.get_active_jobs = get_active_jobs
+        self._recent_rows: tuple[ProjectCardRow, ...] | None = None
+        self._recent_cards: dict[int, tuple[ProjectCardRow, QFrame]] = {}
 
         layout = QVBoxLayout(self)
         title = QLabel("Dashboard Studio")
@@ -364,11 +611,17 @@ class DashboardTab(QWidget):
         recent_layout.addWidget(self.recent_cards_area)
         layout.addWidget(recent_box, 1)
 
-    def refresh_data(self) -> None:
-        projects = self.project_service.list_projects()
-        total = len(projects)
-        to_import = len([p for p in projects if p.status == "a_importer"])
-        ready = len([p for p in projects if p.status == "pret_a_livrer"])
+    def refresh_data(self, projects: list | None = None) -> None:
+        if projects is None:
+            # Standalone refresh: aggregate in SQL and load only the recent rows.
+            counts = self.project_service.count_by_status()
+            recent = self.project_service.list_recent_projects(limit=10)
+        else:
+            counts = Counter(project.status for project in projects)
+            recent = projects[:10]
+        total = sum(counts.values())
+        to_import = counts.get("a_importer", 0)
+        ready = counts.get("pret_a_livrer", 0)
         active_jobs = int(self.get_active_jobs())
 
         self.total_projects_label.setText(str(total))
@@ -376,16 +629,15 @@ class DashboardTab(QWidget):
         self.ready_label.setText(str(ready))
         self.jobs_label.setText(str(active_jobs))
 
-        recent = projects[:10]
-        self._clear_recent_cards()
-        if not recent:
-            empty = QLabel("Aucun projet recent.")
-            empty.setObjectName("CardMuted")
-            self.recent_cards_layout.addWidget(empty)
-        else:
-            for project in recent:
-                self.recent_cards_layout.addWidget(self._build_recent_project_card(project))
-        self.recent_cards_layout.addStretch(1)
+        rows = tuple(_build_project_card_rows(recent, self.project_service.get_status_label))
+        if rows == self._recent_rows:
+            return
+        self._recent_rows = rows
+        self.recent_cards_content.setUpdatesEnabled(False)
+        try:
+            self._fill_recent_cards(rows)
+        finally:
+            self.recent_cards_content.setUpdatesEnabled(True)
 
     @staticmethod
     def _build_card(parent_layout: QHBoxLayout, title: str, value: str) -> QLabel:
@@ -398,14 +650,34 @@ class DashboardTab(QWidget):
         parent_layout.addWidget(box, 1)
         return value_label
 
-    def _clear_recent_cards(self) -> None:
+    def _fill_recent_cards(self, rows: tuple[ProjectCardRow, ...]) -> None:
+        # Cards whose row is unchanged are kept (with their expanded state);
+        # the others are rebuilt.
+        wanted = {row.id: row for row in rows}
+        for project_id, (cached_row, card) in list(self._recent_cards.items()):
+            if wanted.get(project_id) != cached_row:
+                del self._recent_cards[project_id]
+                card.deleteLater()
+        kept = {card for _row, card in self._recent_cards.values()}
         while self.recent_cards_layout.count():
             item = self.recent_cards_layout.takeAt(0)
             widget = item.widget()
-            if widget is not None:
+            if widget is not None and widget not in kept:
                 widget.deleteLater()
 
-    def _build_recent_project_card(self, project) -> QWidget:
+        if not rows:
+            empty = QLabel("Aucun projet recent.")
+            empty.setObjectName("CardMuted")
+            self.recent_cards_layout.addWidget(empty)
+        for row in rows:
+            entry = self._recent_cards.get(row.id)
+            if entry is None:
+                entry = (row, self._build_recent_project_card(row))
+                self._recent_cards[row.id] = entry
+            self.recent_cards_layout.addWidget(entry[1])
+        self.recent_cards_layout.addStretch(1)
+
+    def _build_recent_project_card(self, row: ProjectCardRow) -> QWidget:
         card = QFrame()
         card.setObjectName("DataCard")
         card_layout = QVBoxLayout(card)
@@ -415,9 +687,9 @@ class DashboardTab(QWidget):
         header = QHBoxLayout()
         header.setContentsMargins(0, 0, 0, 0)
         header.setSpacing(10)
-        title = QLabel(project.name)
+        title = QLabel(row.name)
         title.setObjectName("CardTitle")
-        status_label = QLabel(self.project_service.get_status_label(project.status))
+        status_label = QLabel(row.status_label)
         status_label.setObjectName("CardBadge")
         status_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         toggle = QToolButton()
@@ -431,6 +703,21 @@ class DashboardTab(QWidget):
         header.addWidget(toggle)
         card_layout.addLayout(header)
 
+        # The details panel starts collapsed; build it on first expansion only.
+        built: list[QWidget] = []
+
+        def _on_toggle(expanded: bool, btn=toggle):
+            if expanded and not built:
+                built.append(self._build_recent_card_details(row))
+                card_layout.addWidget(built[0])
+            if built:
+                built[0].setVisible(expanded)
+            btn.setArrowType(Qt.ArrowType.DownArrow if expanded else Qt.ArrowType.RightArrow)
+
+        toggle.toggled.connect(_on_toggle)
+        return card
+
+    def _build_recent_card_details(self, row: ProjectCardRow) -> QWidget:
         details = QWidget()
         details.setObjectName("CardDetails")
         details_layout = QFormLayout(details)
@@ -439,18 +726,10 @@ class DashboardTab(QWidget):
         details_layout.setHorizontalSpacing(10)
         details_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
         details_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
-        details_layout.addRow("Client", self._card_value(project.client.name if project.client else "-"))
-        details_layout.addRow("Date", self._card_value(project.shoot_date.strftime("%Y-%m-%d")))
-        details_layout.addRow("Dossier", self._card_value(project.root_path))
-        details.setVisible(False)
-        card_layout.addWidget(details)
-
-        def _on_toggle(expanded: bool, panel=details, btn=toggle):
-            panel.setVisible(expanded)
-            btn.setArrowType(Qt.ArrowType.DownArrow if expanded else Qt.ArrowType.RightArrow)
-
-        toggle.toggled.connect(_on_toggle)
-        return card
+        details_layout.addRow("Client", self._card_value(row.client_name))
+        details_layout.addRow("Date", self._card_value(row.shoot_date))
+        details_layout.addRow("Dossier", self._card_value(row.root_path))
+        return details
 
     @staticmethod
     def _card_value(value: str) -> QLabel:
@@ -480,8 +759,17 @@ class JobsTab(QWidget):
 
         self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(5000)
         layout.addWidget(self.log_text, 1)
 
+        # Events are stamped on arrival but written in batches, so a burst of
+        # job messages costs one append and one relayout.
+        self._pending_log: list[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_pending_log)
+
     def refresh_data(self) -> None:
         active = int(self.get_active_jobs())
         if active <= 0:
@@ -491,12 +779,643 @@ class JobsTab(QWidget):
 
     def add_event(self, message: str) -> None:
         stamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.appendPlainText(f"[{stamp}] {message}")
+        self._pending_log.append(f"[{stamp}] {message}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_pending_log(self) -> None:
+        if self._pending_log:
+            self.log_text.appendPlainText("\n".join(self._pending_log))
+            self._pending_log.clear()
 
     def _clear_logs(self) -> None:
+        self._log_flush_timer.stop()
+        self._pending_log.clear()
         self.log_text.clear()
 
 
+# Applied once at application level by MainWindow._apply_sprint1_style.
+_SPRINT1_STYLE_TEMPLATE = """
+QWidget {
+    background: %(bg_app)s;
+    color: %(text_primary)s;
+    font-family: "Segoe UI";
+    font-size: 12px;
+}
+QLabel {
+    background: transparent;
+    color: %(text_primary)s;
+}
+QWidget#SideBar {
+    background: %(bg_panel)s;
+    border: 1px solid %(border_subtle)s;
+    border-radius: 14px;
+    color: %(text_primary)s;
+    padding: 8px;
+}
+QPushButton#SideBarToggle {
+    text-align: center;
+    border-radius: 8px;
+    border: 1px solid %(border_subtle)s;
+    background: %(bg_card)s;
+    color: %(text_primary)s;
+    padding: 6px 0;
+    margin: 0 0 6px 0;
+}
+QPushButton#SideBarToggle:hover {
+    background: %(bg_hover)s;
+    border-color: %(accent_subtle_hover)s;
+}
+QPushButton[navButton="true"] {
+    text-align: left;
+    border-radius: 8px;
+    padding: 10px 12px;
+    margin: 2px 0;
+    border: 1px solid transparent;
+    background: transparent;
+    color: %(text_primary)s;
+}
+QPushButton[navButton="true"][collapsed="true"] {
+    text-align: center;
+    padding: 10px 0;
+}
+QPushButton[navButton="true"]:hover {
+    background: %(bg_hover)s;
+    border-color: %(border_focus)s;
+}
+QPushButton[navButton="true"][active="true"] {
+    background: %(accent_subtle_soft)s;
+    border-color: %(accent_subtle_hover)s;
+    color: %(text_primary)s;
+}
+#TopBar {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 12px;
+    background: %(bg_panel)s;
+}
+#AppTitle {
+    font-size: 18px;
+    font-weight: 700;
+    color: %(text_primary)s;
+}
+#ActivityBadge {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    padding: 4px 10px;
+    background: %(bg_card)s;
+    color: %(text_secondary)s;
+    font-weight: 600;
+}
+#ContextModeBadge {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    padding: 3px 10px;
+    background: %(bg_card)s;
+    color: %(text_primary)s;
+    font-weight: 700;
+}
+#ContextHintLabel {
+    color: %(text_secondary)s;
+    padding-left: 6px;
+}
+#PageTitle {
+    font-size: 20px;
+    font-weight: 700;
+    color: %(text_primary)s;
+}
+#StatCard {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 12px;
+    background: %(bg_panel)s;
+}
+#StatValue {
+    font-size: 26px;
+    font-weight: 700;
+    color: %(accent_subtle_hover)s;
+}
+QFrame#DataCard {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    background: %(bg_card)s;
+}
+QFrame#DataCard[selected="true"] {
+    border-color: %(accent_subtle_hover)s;
+    background: %(accent_subtle_soft)s;
+}
+QLabel#CardTitle {
+    color: %(text_primary)s;
+    font-size: 13px;
+    font-weight: 600;
+}
+QLabel#CardValue {
+    color: %(text_secondary)s;
+    background: transparent;
+}
+QLabel#CardMuted {
+    color: %(text_muted)s;
+    background: transparent;
+    padding: 8px 4px;
+}
+QLabel#CardBadge {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 9px;
+    background: %(bg_panel)s;
+    color: %(text_secondary)s;
+    padding: 2px 8px;
+    font-size: 11px;
+    font-weight: 600;
+}
+QWidget#CardDetails {
+    border-top: 1px solid %(border_subtle)s;
+    background: transparent;
+    padding-top: 12px;
+}
+QFrame#PreviewFrame {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    background: %(bg_panel)s;
+}
+QLabel#PreviewLabel {
+    background: %(bg_panel)s;
+    border-radius: 8px;
+    color: %(text_muted)s;
+}
+QLabel#CullingMeta {
+    color: %(text_secondary)s;
+    padding-left: 2px;
+}
+QLabel#CullingHud {
+    border-radius: 10px;
+    padding: 6px 10px;
+    margin: 8px;
+    font-size: 11px;
+    font-weight: 700;
+    color: %(text_primary)s;
+    background: %(accent_subtle_hover)s;
+    border: 1px solid %(accent_subtle_hover)s;
+}
+QLabel#CullingHud[hudState="warn"] {
+    color: #FFF1F1;
+    background: #8B2C2C;
+    border-color: #A83A3A;
+}
+QLabel#CullingHud[hudState="info"] {
+    color: %(text_primary)s;
+    background: #2C2C2C;
+    border-color: #4A4A4A;
+}
+QLabel#PreviewInfoOverlay {
+    background: rgba(10, 12, 16, 128);
+    color: #E9EEF2;
+    border-radius: 6px;
+    padding: 6px 10px;
+    margin: 8px;
+}
+QLabel#PreviewPathOverlay {
+    background: rgba(10, 12, 16, 128);
+    color: #B8C1CA;
+    border-radius: 6px;
+    padding: 6px 10px;
+    margin: 8px;
+}
+QFrame#FilmstripFrame {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    background: %(bg_panel)s;
+}
+QToolButton#FilmThumb {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 7px;
+    background: %(bg_card)s;
+    padding: 2px;
+}
+QToolButton#FilmThumb:hover {
+    border-color: %(border_focus)s;
+    background: %(bg_hover)s;
+}
+QToolButton#FilmThumb[selected="true"] {
+    border-color: %(accent_subtle_hover)s;
+    background: %(accent_subtle_soft)s;
+}
+QGroupBox#BatchPanel {
+    border: 1px solid %(border_subtle)s;
+    background: %(bg_panel)s;
+}
+QFrame#EditDock {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 12px;
+    background: %(bg_panel)s;
+}
+QFrame#EditHeaderBar {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    background: %(bg_panel)s;
+}
+QLabel#EditFilterLabel {
+    color: rgba(233, 238, 244, 150);
+    font-size: 11px;
+    font-weight: 500;
+    font-family: "Roboto", "Segoe UI";
+    background: transparent;
+}
+QFrame#EditAssetList {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 12px;
+    background: %(bg_panel)s;
+}
+QFrame#PresetFormPanel {
+    background: transparent;
+}
+QFrame#PresetSidebar {
+    border-left: 1px solid %(border_subtle)s;
+    background: %(bg_panel)s;
+    border-radius: 10px;
+}
+QLineEdit#PresetSearch {
+    min-height: 30px;
+}
+QFrame#PresetActionBar {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    background: %(bg_card)s;
+}
+QGroupBox#PresetSectionBox {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    margin-top: 10px;
+    background: %(bg_card)s;
+    padding-top: 6px;
+}
+QGroupBox#PresetSectionBox::title {
+    left: 12px;
+    padding: 0 2px;
+    color: #AAB4BE;
+    font-size: 10px;
+    font-weight: 700;
+    background: transparent;
+}
+QGroupBox#PresetProfileCard {
+    border: 1px solid #444444;
+    border-radius: 12px;
+    margin-top: 0px;
+    background: #2A2A2A;
+    padding-top: 0px;
+}
+QGroupBox#PresetProfileCard:hover {
+    border-color: %(accent_subtle_hover)s;
+}
+QFrame#PresetProfileHeader {
+    border-bottom: 1px solid %(border_subtle)s;
+    border-top-left-radius: 11px;
+    border-top-right-radius: 11px;
+    border-left: 3px solid %(accent_subtle_hover)s;
+    background: #303030;
+}
+QLabel#PresetProfileTitle {
+    color: %(text_primary)s;
+    font-size: 13px;
+    font-weight: 700;
+    letter-spacing: 0.4px;
+    background: transparent;
+}
+QLabel#PresetProfileHint {
+    color: %(text_secondary)s;
+    font-size: 11px;
+    background: transparent;
+}
+QGroupBox#PresetProfileCard QLabel#PresetProfileFieldLabel {
+    color: #BAC3CF;
+    font-size: 11px;
+    font-weight: 600;
+    background: transparent;
+}
+QLabel#EditAssetListTitle {
+    color: #C6C6C6;
+    font-size: 11px;
+    font-weight: 700;
+    letter-spacing: 1px;
+    padding: 2px 4px 0 4px;
+}
+QLabel#EditThumb {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 6px;
+    background: %(bg_panel)s;
+}
+QGroupBox#EditParamGroup, QGroupBox#EditActionGroup {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    margin-top: 10px;
+    background: %(bg_card)s;
+    padding-top: 6px;
+}
+QGroupBox#EditParamGroup::title, QGroupBox#EditActionGroup::title {
+    left: 12px;
+    padding: 0 2px;
+    color: #AAB4BE;
+    font-size: 10px;
+    font-weight: 700;
+    background: transparent;
+}
+QLabel#EditFieldLabel {
+    color: #C4C4C4;
+    font-size: 12px;
+    font-weight: 500;
+    font-family: "Segoe UI";
+    background: transparent;
+}
+QLabel#EditFieldValue {
+    color: %(text_primary)s;
+    background: #2B2B2B;
+    border: 1px solid #4A4A4A;
+    border-radius: 6px;
+    padding: 2px 6px;
+    font-weight: 600;
+}
+QSlider::groove:horizontal {
+    border: none;
+    height: 8px;
+    border-radius: 4px;
+    background: #3B3B3B;
+}
+QSlider::sub-page:horizontal {
+    border: none;
+    border-radius: 4px;
+    background: %(accent_subtle)s;
+}
+QSlider::add-page:horizontal {
+    border: none;
+    border-radius: 4px;
+    background: #2E2E2E;
+}
+QSlider::handle:horizontal {
+    width: 16px;
+    margin: -5px 0;
+    border: 1px solid #D0D0D0;
+    border-radius: 8px;
+    background: #F0F0F0;
+}
+QSlider::handle:horizontal:hover {
+    border-color: %(accent_subtle_hover)s;
+}
+QPushButton[cardSelect="true"] {
+    text-align: left;
+    border: 1px solid transparent;
+    border-radius: 6px;
+    background: transparent;
+    color: %(text_primary)s;
+    font-weight: 600;
+    padding: 6px 8px;
+}
+QPushButton[cardSelect="true"]:hover {
+    background: %(bg_hover)s;
+    border-color: %(border_focus)s;
+}
+QToolButton[cardToggle="true"] {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 6px;
+    background: %(bg_card)s;
+    color: %(text_primary)s;
+    padding: 2px;
+}
+QToolButton[cardToggle="true"]:hover {
+    border-color: %(accent_subtle_hover)s;
+    background: %(bg_hover)s;
+}
+QScrollArea {
+    border: none;
+    background: transparent;
+}
+QScrollArea > QWidget > QWidget {
+    background: transparent;
+}
+QScrollBar:vertical {
+    background: transparent;
+    width: 12px;
+    margin: 4px 2px 4px 2px;
+    border: none;
+}
+QScrollBar::handle:vertical {
+    background: %(scrollbar_handle)s;
+    min-height: 44px;
+    border-radius: 6px;
+    margin: 0 2px 0 2px;
+}
+QScrollBar::handle:vertical:hover {
+    background: %(scrollbar_handle_hover)s;
+}
+QScrollBar::handle:vertical:pressed {
+    background: %(scrollbar_handle_pressed)s;
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+    background: transparent;
+    border: none;
+}
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+    background: %(scrollbar_track)s;
+    border-radius: 6px;
+    margin: 0 2px 0 2px;
+}
+QScrollBar:horizontal {
+    background: transparent;
+    height: 12px;
+    margin: 2px 4px 2px 4px;
+    border: none;
+}
+QScrollBar::handle:horizontal {
+    background: %(scrollbar_handle)s;
+    min-width: 44px;
+    border-radius: 6px;
+    margin: 2px 0 2px 0;
+}
+QScrollBar::handle:horizontal:hover {
+    background: %(scrollbar_handle_hover)s;
+}
+QScrollBar::handle:horizontal:pressed {
+    background: %(scrollbar_handle_pressed)s;
+}
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0px;
+    background: transparent;
+    border: none;
+}
+QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+    background: %(scrollbar_track)s;
+    border-radius: 6px;
+    margin: 2px 0 2px 0;
+}
+QAbstractScrollArea::corner {
+    background: transparent;
+}
+QGroupBox {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    margin-top: 8px;
+    padding-top: 8px;
+    background: %(bg_panel)s;
+}
+QGroupBox::title {
+    left: 10px;
+    padding: 0 4px;
+    color: %(text_secondary)s;
+    background: transparent;
+}
+QTabWidget::pane {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 10px;
+    background: %(bg_panel)s;
+    top: -1px;
+}
+QTabBar::tab {
+    background: %(bg_card)s;
+    border: 1px solid %(border_subtle)s;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+    color: %(text_secondary)s;
+    min-width: 90px;
+    padding: 6px 12px;
+    margin-right: 4px;
+}
+QTabBar::tab:hover {
+    color: %(text_primary)s;
+    border-color: %(border_focus)s;
+}
+QTabBar::tab:selected {
+    color: %(text_primary)s;
+    border-color: %(accent_subtle_hover)s;
+    background: %(bg_hover)s;
+}
+QLineEdit, QComboBox, QDateEdit, QSpinBox, QDoubleSpinBox, QPlainTextEdit, QTableWidget {
+    border: 1px solid transparent;
+    border-radius: 8px;
+    background: %(bg_card)s;
+    color: %(text_primary)s;
+    padding: 4px 6px;
+}
+QLineEdit:focus, QComboBox:focus, QDateEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QPlainTextEdit:focus, QTableWidget:focus {
+    border: 1px solid %(accent)s;
+}
+QTableWidget::item:selected {
+    background: %(accent_soft_hover)s;
+    color: %(text_primary)s;
+}
+QHeaderView::section {
+    background: %(bg_card)s;
+    color: %(text_secondary)s;
+    border: none;
+    border-bottom: 1px solid %(border_subtle)s;
+    padding: 6px;
+}
+QProgressBar {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 7px;
+    background: %(bg_card)s;
+    color: %(text_secondary)s;
+    text-align: center;
+}
+QProgressBar::chunk {
+    background: %(accent_subtle_hover)s;
+    border-radius: 6px;
+}
+QPushButton {
+    border: 1px solid %(border_subtle)s;
+    border-radius: 8px;
+    background: %(bg_card)s;
+    color: %(text_primary)s;
+    padding: 6px 12px;
+}
+QPushButton:hover {
+    background: %(bg_hover)s;
+    border-color: %(border_focus)s;
+}
+QPushButton:pressed {
+    background: %(bg_panel)s;
+}
+QPushButton[isPrimaryButton="true"] {
+    background: %(accent_subtle_soft)s;
+    border-color: %(accent_subtle)s;
+    color: %(text_primary)s;
+    font-weight: 600;
+}
+QPushButton[isPrimaryButton="true"]:hover {
+    background: %(accent_subtle_soft_hover)s;
+    border-color: %(accent_subtle_hover)s;
+}
+QPushButton[isPrimaryButton="true"]:pressed {
+    background: %(accent_subtle_soft)s;
+    border-color: %(accent_subtle_pressed)s;
+    color: %(text_primary)s;
+}
+QPushButton:disabled {
+    background: %(bg_panel)s;
+    border-color: %(border_subtle)s;
+    color: %(text_muted)s;
+}
+QPushButton[isPrimaryButton="true"]:disabled {
+    background: %(bg_panel)s;
+    border-color: %(border_subtle)s;
+    color: %(text_muted)s;
+}
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _build_sprint1_stylesheet(accent: str) -> str:
+    accent_hover = _lighter(accent, 15)
+    accent_pressed = _darker(accent, 20)
+    accent_muted = _blend(accent, "#1A1D21", 0.78)
+    accent_soft = _rgba(accent, 32)
+    accent_soft_hover = _rgba(accent, 56)
+    accent_subtle = _blend(accent, "#1A1D21", 0.68)
+    accent_subtle_hover = _lighter(accent_subtle, 8)
+    accent_subtle_pressed = _darker(accent_subtle, 10)
+    accent_subtle_soft = _rgba(accent_subtle, 34)
+    accent_subtle_soft_hover = _rgba(accent_subtle, 62)
+    # Photoshop-like neutral grayscale palette (no blue tint).
+    bg_app = "#121212"
+    bg_panel = "#1A1A1A"
+    bg_card = "#242424"
+    bg_hover = "#2D2D2D"
+    border_subtle = "#3A3A3A"
+    border_focus = "#545454"
+    text_primary = "#E8E8E8"
+    text_secondary = "#B2B2B2"
+    text_muted = "#7A7A7A"
+    scrollbar_track = "#1A1A1A"
+    scrollbar_handle = "#4A4A4A"
+    scrollbar_handle_hover = "#5D5D5D"
+    scrollbar_handle_pressed = "#707070"
+    return (
+        _SPRINT1_STYLE_TEMPLATE
+        % {
+            "accent": accent,
+            "accent_hover": accent_hover,
+            "accent_pressed": accent_pressed,
+            "accent_muted": accent_muted,
+            "accent_soft": accent_soft,
+            "accent_soft_hover": accent_soft_hover,
+            "accent_subtle": accent_subtle,
+            "accent_subtle_hover": accent_subtle_hover,
+            "accent_subtle_pressed": accent_subtle_pressed,
+            "accent_subtle_soft": accent_subtle_soft,
+            "accent_subtle_soft_hover": accent_subtle_soft_hover,
+            "bg_app": bg_app,
+            "bg_panel": bg_panel,
+            "bg_card": bg_card,
+            "bg_hover": bg_hover,
+            "border_subtle": border_subtle,
+            "border_focus": border_focus,
+            "text_primary": text_primary,
+            "text_secondary": text_secondary,
+            "text_muted": text_muted,
+            "scrollbar_track": scrollbar_track,
+            "scrollbar_handle": scrollbar_handle,
+            "scrollbar_handle_hover": scrollbar_handle_hover,
+            "scrollbar_handle_pressed": scrollbar_handle_pressed,
+        }
+    )
+
+
 class MainWindow(QMainWindow):
     SIDEBAR_EXPANDED_WIDTH = 200
     SIDEBAR_COLLAPSED_WIDTH = 60
@@ -557,6 +1476,25 @@ class MainWindow(QMainWindow):
         self.storage_service = storage_service
         self.on_reload_runtime = on_reload_runtime
         self.active_ops_count = 0
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._do_refresh_all)
+        self._refresh_seq = 0
+        self._project_cache = ProjectListCache(project_service)
+        self._full_refresh_pending = False
+        self._asset_refresh_ids: set[int] = set()
+        # Tabs whose project combos wait for the next background snapshot.
+        self._tabs_awaiting_projects: list[QWidget] = []
+        self._fetch_workers: set[JobWorker] = set()
+        self._thread_pool = QThreadPool.globalInstance()
+        self._thread_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) // 2))
+        self._pending_search = ""
+        self._context_combo_sig: tuple | None = None
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._apply_pending_search)
         self.accent_color = normalize_accent_color(self.storage_service.get_settings().get("accent_color"))
 
         # Load optional Fluent widgets only after QApplication exists.
@@ -608,6 +1546,7 @@ class MainWindow(QMainWindow):
         topbar = QGroupBox()
         topbar.setObjectName("TopBar")
         topbar.setFixedHeight(70)
+        self.topbar = topbar
         topbar_layout = QHBoxLayout(topbar)
         topbar_layout.setContentsMargins(14, 12, 14, 12)
 
@@ -646,46 +1585,35 @@ class MainWindow(QMainWindow):
 
         self.stack = QStackedWidget()
         self.dashboard_tab = DashboardTab(self.project_service, get_active_jobs=self._get_active_jobs_count)
-        self.hub_tab = HubTab(self.project_service, self.preset_service, on_data_changed=self.refresh_all)
-        self.import_export_tab = ImportExportTab(
-            project_service=self.project_service,
-            preset_service=self.preset_service,
-            culling_service=self.culling_service,
-            edit_service=self.edit_service,
-            metadata_service=self.metadata_service,
-            import_service=self.import_service,
-            export_service=self.export_service,
-            job_queue_service=self.job_queue_service,
-            on_data_changed=self.refresh_all,
-            on_operation_started=self._on_operation_started,
-            on_operation_ended=self._on_operation_ended,
-            on_job_event=self._append_job_event,
-        )
-        self.import_export_tab.sections.currentChanged.connect(self._on_import_export_section_changed)
-        self.rename_tab = BatchRenameTab(
-            project_service=self.project_service,
-            culling_service=self.culling_service,
-            rename_service=self.rename_service,
-            on_data_changed=self.refresh_all,
-            on_operation_started=self._on_operation_started,
-            on_operation_ended=self._on_operation_ended,
-            on_job_event=self._append_job_event,
-        )
-        self.presets_tab = PresetTab(self.preset_service, on_data_changed=self.refresh_all)
-        self.settings_tab = SettingsTab(
-            storage_service=self.storage_service,
-            is_busy=self.is_busy,
-            on_migration_completed=self._reload_runtime_after_migration,
-            on_theme_changed=self._on_theme_settings_changed,
-        )
         self.jobs_tab = JobsTab(get_active_jobs=self._get_active_jobs_count)
+        # Other pages are built on first visit (see _ensure_tab).
+        self.hub_tab: HubTab | None = None
+        self.import_export_tab: ImportExportTab | None = None
+        self.rename_tab: BatchRenameTab | None = None
+        self.presets_tab: PresetTab | None = None
+        self.settings_tab: SettingsTab | None = None
+        self._tab_factories: dict[str, Callable[[], QWidget]] = {
+            "hub_tab": lambda: HubTab(self.project_service, self.preset_service, on_data_changed=self.refresh_all),
+            "import_export_tab": self._create_import_export_tab,
+            "rename_tab": lambda: BatchRenameTab(
+                project_service=self.project_service,
+                culling_service=self.culling_service,
+                rename_service=self.rename_service,
+                on_data_changed=self.refresh_all,
+                on_operation_started=self._on_operation_started,
+                on_operation_ended=self._on_operation_ended,
+                on_job_event=self._append_job_event,
+            ),
+            "presets_tab": lambda: PresetTab(self.preset_service, on_data_changed=self.refresh_all),
+            "settings_tab": lambda: SettingsTab(
+                storage_service=self.storage_service,
+                is_busy=self.is_busy,
+                on_migration_completed=self._reload_runtime_after_migration,
+                on_theme_changed=self._on_theme_settings_changed,
+            ),
+        }
 
         self.stack.addWidget(self.dashboard_tab)
-        self.stack.addWidget(self.hub_tab)
-        self.stack.addWidget(self.import_export_tab)
-        self.stack.addWidget(self.rename_tab)
-        self.stack.addWidget(self.presets_tab)
-        self.stack.addWidget(self.settings_tab)
         self.stack.addWidget(self.jobs_tab)
         content_layout.addWidget(self.stack, 1)
         root_layout.addWidget(content, 1)
@@ -697,7 +1625,45 @@ class MainWindow(QMainWindow):
         self._apply_sidebar_state()
         self._switch_page("dashboard")
 
-        self.refresh_all()
+        self.refresh_all_now()
+
+    def _create_import_export_tab(self) -> ImportExportTab:
+        tab = ImportExportTab(
+            project_service=self.project_service,
+            preset_service=self.preset_service,
+            culling_service=self.culling_service,
+            edit_service=self.edit_service,
+            metadata_service=self.metadata_service,
+            import_service=self.import_service,
+            export_service=self.export_service,
+            job_queue_service=self.job_queue_service,
+            on_data_changed=self.refresh_all,
+            on_operation_started=self._on_operation_started,
+            on_operation_ended=self._on_operation_ended,
+            on_job_event=self._append_job_event,
+        )
+        tab.sections.currentChanged.connect(self._on_import_export_section_changed)
+        return tab
+
+    def _ensure_tab(self, name: str) -> QWidget:
+        tab = getattr(self, name)
+        if tab is not None:
+            return tab
+        tab = self._tab_factories[name]()
+        setattr(self, name, tab)
+        self.stack.addWidget(tab)
+        if name in {"hub_tab", "import_export_tab", "rename_tab"}:
+            tab.refresh_data(self._project_cache.get_projects())
+        else:
+            tab.refresh_data()
+        project_id = self.project_context_combo.currentData()
+        if isinstance(tab, HubTab):
+            tab.set_name_filter(self._pending_search)
+            if project_id is not None:
+                tab.select_project_by_id(int(project_id))
+        elif project_id is not None and hasattr(tab, "set_selected_project"):
+            tab.set_selected_project(int(project_id))
+        return tab
 
     def _focus_global_search(self) -> None:
         self.search_edit.setFocus()
@@ -723,9 +1689,7 @@ class MainWindow(QMainWindow):
         self.jobs_tab.add_event(message)
 
     def _build_search_line_edit(self):
-        if QFLUENT_AVAILABLE and FluentSearchLineEdit is not None:
-            return FluentSearchLineEdit()
-        return QLineEdit()
+        return _SEARCH_LINE_EDIT_CLS()
 
     def _apply_theme(self) -> None:
         self.accent_color = normalize_accent_color(self.accent_color)
@@ -745,7 +1709,11 @@ class MainWindow(QMainWindow):
 
     def _on_theme_settings_changed(self) -> None:
         settings = self.storage_service.get_settings()
-        self.accent_color = normalize_accent_color(settings.get("accent_color"))
+        accent_color = normalize_accent_color(settings.get("accent_color"))
+        if accent_color != self.accent_color:
+            # Shades derived from the previous accent will not be asked for again.
+            _reset_color_caches()
+        self.accent_color = accent_color
         self._apply_theme()
         self._apply_sidebar_state()
         self._append_job_event(f"Theme mis a jour (accent {self.accent_color}).")
@@ -803,22 +1771,15 @@ class MainWindow(QMainWindow):
         return super().eventFilter(obj, event)
 
     def _restore_layout_after_sidebar_toggle(self) -> None:
-        try:
-            self.import_export_tab.culling_tab.reset_layout_after_shell_resize()
-        except Exception:
-            pass
-        try:
-            self.import_export_tab.edit_tab.reset_layout_after_shell_resize()
-        except Exception:
-            pass
-        try:
-            self.rename_tab.reset_layout_after_shell_resize()
-        except Exception:
-            pass
-        try:
-            self.presets_tab.reset_layout_after_shell_resize()
-        except Exception:
-            pass
+        resizable = []
+        if self.import_export_tab is not None:
+            resizable.extend([self.import_export_tab.culling_tab, self.import_export_tab.edit_tab])
+        resizable.extend(tab for tab in (self.rename_tab, self.presets_tab) if tab is not None)
+        for tab in resizable:
+            try:
+                tab.reset_layout_after_shell_resize()
+            except Exception:
+                pass
 
     def _build_nav_button(self, key: str) -> QPushButton:
         label = key
@@ -867,21 +1828,7 @@ class MainWindow(QMainWindow):
     def _fluent_icon(self, icon_name: str) -> QIcon:
         if not QFLUENT_AVAILABLE or FIF is None or not icon_name:
             return QIcon()
-        icon_ref = getattr(FIF, icon_name, None)
-        if icon_ref is None:
-            return QIcon()
-        try:
-            icon = icon_ref.icon()
-            if isinstance(icon, QIcon):
-                return icon
-        except Exception:
-            pass
-        try:
-            if isinstance(icon_ref, QIcon):
-                return icon_ref
-        except Exception:
-            pass
-        return QIcon()
+        return _load_fluent_icon(icon_name)
 
     def _fallback_nav_icon(self, icon_name: str) -> QIcon:
         style = self.style()
@@ -917,25 +1864,17 @@ class MainWindow(QMainWindow):
         if normalized == "dashboard":
             self.stack.setCurrentWidget(self.dashboard_tab)
         elif normalized == "projects":
-            self.stack.setCurrentWidget(self.hub_tab)
-        elif normalized == "ingest":
-            self.stack.setCurrentWidget(self.import_export_tab)
-            self.import_export_tab.set_current_section("import")
-        elif normalized == "culling":
-            self.stack.setCurrentWidget(self.import_export_tab)
-            self.import_export_tab.set_current_section("culling")
+            self.stack.setCurrentWidget(self._ensure_tab("hub_tab"))
+        elif normalized in {"ingest", "culling", "edit", "export"}:
+            import_export_tab = self._ensure_tab("import_export_tab")
+            self.stack.setCurrentWidget(import_export_tab)
+            import_export_tab.set_current_section("import" if normalized == "ingest" else normalized)
         elif normalized == "rename":
-            self.stack.setCurrentWidget(self.rename_tab)
-        elif normalized == "edit":
-            self.stack.setCurrentWidget(self.import_export_tab)
-            self.import_export_tab.set_current_section("edit")
-        elif normalized == "export":
-            self.stack.setCurrentWidget(self.import_export_tab)
-            self.import_export_tab.set_current_section("export")
+            self.stack.setCurrentWidget(self._ensure_tab("rename_tab"))
         elif normalized == "presets":
-            self.stack.setCurrentWidget(self.presets_tab)
+            self.stack.setCurrentWidget(self._ensure_tab("presets_tab"))
         elif normalized == "settings":
-            self.stack.setCurrentWidget(self.settings_tab)
+            self.stack.setCurrentWidget(self._ensure_tab("settings_tab"))
         elif normalized == "jobs":
             self.stack.setCurrentWidget(self.jobs_tab)
         self._update_context_bar(normalized)
@@ -945,11 +1884,17 @@ class MainWindow(QMainWindow):
         if not normalized:
             return
         self.current_nav_key = normalized
-        for nav_key, button in self.nav_buttons.items():
-            button.setProperty("active", "true" if nav_key == normalized else "false")
-            button.style().unpolish(button)
-            button.style().polish(button)
-            button.update()
+        # Only buttons whose state flipped need a style pass.
+        self.nav_panel.setUpdatesEnabled(False)
+        try:
+            for nav_key, button in self.nav_buttons.items():
+                active = "true" if nav_key == normalized else "false"
+                if button.property("active") == active:
+                    continue
+                button.setProperty("active", active)
+                self._refresh_widget_style(button)
+        finally:
+            self.nav_panel.setUpdatesEnabled(True)
 
     def _on_import_export_section_changed(self, index: int) -> None:
         if self.stack.currentWidget() is not self.import_export_tab:
@@ -971,23 +1916,24 @@ class MainWindow(QMainWindow):
             return
         self.activity_badge.setText(f"{active} job(s)")
 
-    def _refresh_project_context_combo(self) -> None:
+    def _refresh_project_context_combo(self, projects: list | None = None) -> None:
         current = self.project_context_combo.currentData()
-        projects = self.project_service.list_projects()
-
-        self.project_context_combo.blockSignals(True)
-        self.project_context_combo.clear()
-        self.project_context_combo.addItem("Aucun contexte", userData=None)
-        for project in projects:
-            self.project_context_combo.addItem(project.name, userData=project.id)
-
-        target_idx = 0
-        if current is not None:
-            idx = self.project_context_combo.findData(current)
-            if idx >= 0:
-                target_idx = idx
-        self.project_context_combo.setCurrentIndex(target_idx)
-        self.project_context_combo.blockSignals(False)
+        if projects is None:
+            projects = self.project_service.list_projects()
+
+        context_sig = tuple((project.id, project.name) for project in projects)
+        if context_sig != self._context_combo_sig:
+            self._context_combo_sig = context_sig
+            self.project_context_combo.blockSignals(True)
+            self.project_context_combo.clear()
+            self.project_context_combo.addItem("Aucun contexte", userData=None)
+            target_idx = 0
+            for idx, (project_id, project_name) in enumerate(context_sig, start=1):
+                self.project_context_combo.addItem(project_name, userData=project_id)
+                if project_id == current:
+                    target_idx = idx
+            self.project_context_combo.setCurrentIndex(target_idx)
+            self.project_context_combo.blockSignals(False)
 
         self._on_project_context_changed()
 
@@ -995,16 +1941,52 @@ class MainWindow(QMainWindow):
         project_id = self.project_context_combo.currentData()
         if project_id is None:
             return
-        self.import_export_tab.set_selected_project(int(project_id))
-        self.hub_tab.select_project_by_id(int(project_id))
-        self.rename_tab.set_selected_project(int(project_id))
+        if self.import_export_tab is not None:
+            self.import_export_tab.set_selected_project(int(project_id))
+        if self.hub_tab is not None:
+            self.hub_tab.select_project_by_id(int(project_id))
+        if self.rename_tab is not None:
+            self.rename_tab.set_selected_project(int(project_id))
 
     def _on_search_text_changed(self, value: str) -> None:
-        self.hub_tab.set_name_filter(value.strip())
+        self._pending_search = value
+        self._search_timer.start()
+
+    def _apply_pending_search(self) -> None:
+        if self.hub_tab is not None:
+            self.hub_tab.set_name_filter(self._pending_search.strip())
 
     def _reload_runtime_after_migration(self) -> None:
-        runtime = self.on_reload_runtime()
+        # Reopening the database runs the schema migrations; keep it off the
+        # GUI thread and count it as an operation so a second migration waits.
+        self._on_operation_started()
+        # Until the new services land, the tabs still hold the old ones: any
+        # write would go to the pre-migration database, so lock the shell.
+        self._refresh_timer.stop()
+        self._set_shell_enabled(False)
+        self._append_job_event("Rechargement du runtime apres migration...")
+        self._async_fetch(
+            self._load_reloaded_runtime,
+            self._apply_reloaded_runtime,
+            on_error=self._on_runtime_reload_error,
+        )
+
+    def _load_reloaded_runtime(self, **_job_kwargs):
+        return self.on_reload_runtime()
+
+    def _set_shell_enabled(self, enabled: bool) -> None:
+        for widget in (self.nav_panel, self.topbar, self.stack):
+            widget.setEnabled(enabled)
+
+    def _on_runtime_reload_error(self, message: str) -> None:
+        self._set_shell_enabled(True)
+        self._on_operation_ended()
+        self._append_job_event(f"Erreur rechargement runtime: {message}")
+        QMessageBox.critical(self, "Erreur migration", message)
+
+    def _apply_reloaded_runtime(self, runtime) -> None:
         self.project_service = runtime.project_service
+        self._project_cache.project_service = self.project_service
         self.preset_service = runtime.preset_service
         self.culling_service = runtime.culling_service
         self.edit_service = runtime.edit_service
@@ -1012,658 +1994,159 @@ class MainWindow(QMainWindow):
         self.export_service = runtime.export_service
         self.job_queue_service = runtime.job_queue_service
         self.metadata_service = runtime.metadata_service
-        self.rename_service = runtime.rename_service
-
-        self.dashboard_tab.project_service = self.project_service
-        self.hub_tab.project_service = self.project_service
-        self.hub_tab.preset_service = self.preset_service
-        self.rename_tab.project_service = self.project_service
-        self.rename_tab.culling_service = self.culling_service
-        self.rename_tab.rename_service = self.rename_service
-        self.import_export_tab.import_tab.project_service = self.project_service
-        self.import_export_tab.import_tab.import_service = self.import_service
-        self.import_export_tab.culling_tab.project_service = self.project_service
-        self.import_export_tab.culling_tab.culling_service = self.culling_service
-        self.import_export_tab.edit_tab.project_service = self.project_service
-        self.import_export_tab.edit_tab.edit_service = self.edit_service
-        self.import_export_tab.edit_tab.metadata_service = self.metadata_service
-        self.import_export_tab.export_tab.project_service = self.project_service
-        self.import_export_tab.export_tab.preset_service = self.preset_service
-        self.import_export_tab.export_tab.export_service = self.export_service
-        self.import_export_tab.export_tab.job_queue_service = self.job_queue_service
-        self.presets_tab.preset_service = self.preset_service
-        self._append_job_event("Migration stockage terminee et runtime recharge.")
-        self.refresh_all()
-
-    def refresh_all(self) -> None:
-        self.dashboard_tab.refresh_data()
-        self.hub_tab.refresh_data()
-        self.import_export_tab.refresh_data()
-        self.rename_tab.refresh_data()
-        self.presets_tab.refresh_data()
-        self.settings_tab.refresh_data()
-        self._refresh_project_context_combo()
-        self.jobs_tab.refresh_data()
-        self._update_activity_badge()
-
-    def _apply_sprint1_style(self) -> None:
-        accent = normalize_accent_color(self.accent_color)
-        accent_hover = _lighter(accent, 15)
-        accent_pressed = _darker(accent, 20)
-        accent_muted = _blend(accent, "#1A1D21", 0.78)
-        accent_soft = _rgba(accent, 32)
-        accent_soft_hover = _rgba(accent, 56)
-        accent_subtle = _blend(accent, "#1A1D21", 0.68)
-        accent_subtle_hover = _lighter(accent_subtle, 8)
-        accent_subtle_pressed = _darker(accent_subtle, 10)
-        accent_subtle_soft = _rgba(accent_subtle, 34)
-        accent_subtle_soft_hover = _rgba(accent_subtle, 62)
-        # Photoshop-like neutral grayscale palette (no blue tint).
-        bg_app = "#121212"
-        bg_panel = "#1A1A1A"
-        bg_card = "#242424"
-        bg_hover = "#2D2D2D"
-        border_subtle = "#3A3A3A"
-        border_focus = "#545454"
-        text_primary = "#E8E8E8"
-        text_secondary = "#B2B2B2"
-        text_muted = "#7A7A7A"
-        scrollbar_track = "#1A1A1A"
-        scrollbar_handle = "#4A4A4A"
-        scrollbar_handle_hover = "#5D5D5D"
-        scrollbar_handle_pressed = "#707070"
-
-        self.setStyleSheet(
-            """
-            QWidget {
-                background: %(bg_app)s;
-                color: %(text_primary)s;
-                font-family: "Segoe UI";
-                font-size: 12px;
-            }
-            QLabel {
-                background: transparent;
-                color: %(text_primary)s;
-            }
-            QWidget#SideBar {
-                background: %(bg_panel)s;
-                border: 1px solid %(border_subtle)s;
-                border-radius: 14px;
-                color: %(text_primary)s;
-                padding: 8px;
-            }
-            QPushButton#SideBarToggle {
-                text-align: center;
-                border-radius: 8px;
-                border: 1px solid %(border_subtle)s;
-                background: %(bg_card)s;
-                color: %(text_primary)s;
-                padding: 6px 0;
-                margin: 0 0 6px 0;
-            }
-            QPushButton#SideBarToggle:hover {
-                background: %(bg_hover)s;
-                border-color: %(accent_subtle_hover)s;
-            }
-            QPushButton[navButton="true"] {
-                text-align: left;
-                border-radius: 8px;
-                padding: 10px 12px;
-                margin: 2px 0;
-                border: 1px solid transparent;
-                background: transparent;
-                color: %(text_primary)s;
-            }
-            QPushButton[navButton="true"][collapsed="true"] {
-                text-align: center;
-                padding: 10px 0;
-            }
-            QPushButton[navButton="true"]:hover {
-                background: %(bg_hover)s;
-                border-color: %(border_focus)s;
-            }
-            QPushButton[navButton="true"][active="true"] {
-                background: %(accent_subtle_soft)s;
-                border-color: %(accent_subtle_hover)s;
-                color: %(text_primary)s;
-            }
-            #TopBar {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 12px;
-                background: %(bg_panel)s;
-            }
-            #AppTitle {
-                font-size: 18px;
-                font-weight: 700;
-                color: %(text_primary)s;
-            }
-            #ActivityBadge {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                padding: 4px 10px;
-                background: %(bg_card)s;
-                color: %(text_secondary)s;
-                font-weight: 600;
-            }
-            #ContextModeBadge {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                padding: 3px 10px;
-                background: %(bg_card)s;
-                color: %(text_primary)s;
-                font-weight: 700;
-            }
-            #ContextHintLabel {
-                color: %(text_secondary)s;
-                padding-left: 6px;
-            }
-            #PageTitle {
-                font-size: 20px;
-                font-weight: 700;
-                color: %(text_primary)s;
-            }
-            #StatCard {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 12px;
-                background: %(bg_panel)s;
-            }
-            #StatValue {
-                font-size: 26px;
-                font-weight: 700;
-                color: %(accent_subtle_hover)s;
-            }
-            QFrame#DataCard {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                background: %(bg_card)s;
-            }
-            QFrame#DataCard[selected="true"] {
-                border-color: %(accent_subtle_hover)s;
-                background: %(accent_subtle_soft)s;
-            }
-            QLabel#CardTitle {
-                color: %(text_primary)s;
-                font-size: 13px;
-                font-weight: 600;
-            }
-            QLabel#CardValue {
-                color: %(text_secondary)s;
-                background: transparent;
-            }
-            QLabel#CardMuted {
-                color: %(text_muted)s;
-                background: transparent;
-                padding: 8px 4px;
-            }
-            QLabel#CardBadge {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 9px;
-                background: %(bg_panel)s;
-                color: %(text_secondary)s;
-                padding: 2px 8px;
-                font-size: 11px;
-                font-weight: 600;
-            }
-            QWidget#CardDetails {
-                border-top: 1px solid %(border_subtle)s;
-                background: transparent;
-                padding-top: 12px;
-            }
-            QFrame#PreviewFrame {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                background: %(bg_panel)s;
-            }
-            QLabel#PreviewLabel {
-                background: %(bg_panel)s;
-                border-radius: 8px;
-                color: %(text_muted)s;
-            }
-            QLabel#CullingMeta {
-                color: %(text_secondary)s;
-                padding-left: 2px;
-            }
-            QLabel#CullingHud {
-                border-radius: 10px;
-                padding: 6px 10px;
-                margin: 8px;
-                font-size: 11px;
-                font-weight: 700;
-                color: %(text_primary)s;
-                background: %(accent_subtle_hover)s;
-                border: 1px solid %(accent_subtle_hover)s;
-            }
-            QLabel#CullingHud[hudState="warn"] {
-                color: #FFF1F1;
-                background: #8B2C2C;
-                border-color: #A83A3A;
-            }
-            QLabel#CullingHud[hudState="info"] {
-                color: %(text_primary)s;
-                background: #2C2C2C;
-                border-color: #4A4A4A;
-            }
-            QLabel#PreviewInfoOverlay {
-                background: rgba(10, 12, 16, 128);
-                color: #E9EEF2;
-                border-radius: 6px;
-                padding: 6px 10px;
-                margin: 8px;
-            }
-            QLabel#PreviewPathOverlay {
-                background: rgba(10, 12, 16, 128);
-                color: #B8C1CA;
-                border-radius: 6px;
-                padding: 6px 10px;
-                margin: 8px;
-            }
-            QFrame#FilmstripFrame {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                background: %(bg_panel)s;
-            }
-            QToolButton#FilmThumb {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 7px;
-                background: %(bg_card)s;
-                padding: 2px;
-            }
-            QToolButton#FilmThumb:hover {
-                border-color: %(border_focus)s;
-                background: %(bg_hover)s;
-            }
-            QToolButton#FilmThumb[selected="true"] {
-                border-color: %(accent_subtle_hover)s;
-                background: %(accent_subtle_soft)s;
-            }
-            QGroupBox#BatchPanel {
-                border: 1px solid %(border_subtle)s;
-                background: %(bg_panel)s;
-            }
-            QFrame#EditDock {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 12px;
-                background: %(bg_panel)s;
-            }
-            QFrame#EditHeaderBar {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                background: %(bg_panel)s;
-            }
-            QLabel#EditFilterLabel {
-                color: rgba(233, 238, 244, 150);
-                font-size: 11px;
-                font-weight: 500;
-                font-family: "Roboto", "Segoe UI";
-                background: transparent;
-            }
-            QFrame#EditAssetList {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 12px;
-                background: %(bg_panel)s;
-            }
-            QFrame#PresetFormPanel {
-                background: transparent;
-            }
-            QFrame#PresetSidebar {
-                border-left: 1px solid %(border_subtle)s;
-                background: %(bg_panel)s;
-                border-radius: 10px;
-            }
-            QLineEdit#PresetSearch {
-                min-height: 30px;
-            }
-            QFrame#PresetActionBar {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                background: %(bg_card)s;
-            }
-            QGroupBox#PresetSectionBox {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                margin-top: 10px;
-                background: %(bg_card)s;
-                padding-top: 6px;
-            }
-            QGroupBox#PresetSectionBox::title {
-                left: 12px;
-                padding: 0 2px;
-                color: #AAB4BE;
-                font-size: 10px;
-                font-weight: 700;
-                background: transparent;
-            }
-            QGroupBox#PresetProfileCard {
-                border: 1px solid #444444;
-                border-radius: 12px;
-                margin-top: 0px;
-                background: #2A2A2A;
-                padding-top: 0px;
-            }
-            QGroupBox#PresetProfileCard:hover {
-                border-color: %(accent_subtle_hover)s;
-            }
-            QFrame#PresetProfileHeader {
-                border-bottom: 1px solid %(border_subtle)s;
-                border-top-left-radius: 11px;
-                border-top-right-radius: 11px;
-                border-left: 3px solid %(accent_subtle_hover)s;
-                background: #303030;
-            }
-            QLabel#PresetProfileTitle {
-                color: %(text_primary)s;
-                font-size: 13px;
-                font-weight: 700;
-                letter-spacing: 0.4px;
-                background: transparent;
-            }
-            QLabel#PresetProfileHint {
-                color: %(text_secondary)s;
-                font-size: 11px;
-                background: transparent;
-            }
-            QGroupBox#PresetProfileCard QLabel#PresetProfileFieldLabel {
-                color: #BAC3CF;
-                font-size: 11px;
-                font-weight: 600;
-                background: transparent;
-            }
-            QLabel#EditAssetListTitle {
-                color: #C6C6C6;
-                font-size: 11px;
-                font-weight: 700;
-                letter-spacing: 1px;
-                padding: 2px 4px 0 4px;
-            }
-            QLabel#EditThumb {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 6px;
-                background: %(bg_panel)s;
-            }
-            QGroupBox#EditParamGroup, QGroupBox#EditActionGroup {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                margin-top: 10px;
-                background: %(bg_card)s;
-                padding-top: 6px;
-            }
-            QGroupBox#EditParamGroup::title, QGroupBox#EditActionGroup::title {
-                left: 12px;
-                padding: 0 2px;
-                color: #AAB4BE;
-                font-size: 10px;
-                font-weight: 700;
-                background: transparent;
-            }
-            QLabel#EditFieldLabel {
-                color: #C4C4C4;
-                font-size: 12px;
-                font-weight: 500;
-                font-family: "Segoe UI";
-                background: transparent;
-            }
-            QLabel#EditFieldValue {
-                color: %(text_primary)s;
-                background: #2B2B2B;
-                border: 1px solid #4A4A4A;
-                border-radius: 6px;
-                padding: 2px 6px;
-                font-weight: 600;
-            }
-            QSlider::groove:horizontal {
-                border: none;
-                height: 8px;
-                border-radius: 4px;
-                background: #3B3B3B;
-            }
-            QSlider::sub-page:horizontal {
-                border: none;
-                border-radius: 4px;
-                background: %(accent_subtle)s;
-            }
-            QSlider::add-page:horizontal {
-                border: none;
-                border-radius: 4px;
-                background: #2E2E2E;
-            }
-            QSlider::handle:horizontal {
-                width: 16px;
-                margin: -5px 0;
-                border: 1px solid #D0D0D0;
-                border-radius: 8px;
-                background: #F0F0F0;
-            }
-            QSlider::handle:horizontal:hover {
-                border-color: %(accent_subtle_hover)s;
-            }
-            QPushButton[cardSelect="true"] {
-                text-align: left;
-                border: 1px solid transparent;
-                border-radius: 6px;
-                background: transparent;
-                color: %(text_primary)s;
-                font-weight: 600;
-                padding: 6px 8px;
-            }
-            QPushButton[cardSelect="true"]:hover {
-                background: %(bg_hover)s;
-                border-color: %(border_focus)s;
-            }
-            QToolButton[cardToggle="true"] {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 6px;
-                background: %(bg_card)s;
-                color: %(text_primary)s;
-                padding: 2px;
-            }
-            QToolButton[cardToggle="true"]:hover {
-                border-color: %(accent_subtle_hover)s;
-                background: %(bg_hover)s;
-            }
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollArea > QWidget > QWidget {
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: transparent;
-                width: 12px;
-                margin: 4px 2px 4px 2px;
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                background: %(scrollbar_handle)s;
-                min-height: 44px;
-                border-radius: 6px;
-                margin: 0 2px 0 2px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: %(scrollbar_handle_hover)s;
-            }
-            QScrollBar::handle:vertical:pressed {
-                background: %(scrollbar_handle_pressed)s;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-                background: transparent;
-                border: none;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: %(scrollbar_track)s;
-                border-radius: 6px;
-                margin: 0 2px 0 2px;
-            }
-            QScrollBar:horizontal {
-                background: transparent;
-                height: 12px;
-                margin: 2px 4px 2px 4px;
-                border: none;
-            }
-            QScrollBar::handle:horizontal {
-                background: %(scrollbar_handle)s;
-                min-width: 44px;
-                border-radius: 6px;
-                margin: 2px 0 2px 0;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: %(scrollbar_handle_hover)s;
-            }
-            QScrollBar::handle:horizontal:pressed {
-                background: %(scrollbar_handle_pressed)s;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-                background: transparent;
-                border: none;
-            }
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
-                background: %(scrollbar_track)s;
-                border-radius: 6px;
-                margin: 2px 0 2px 0;
-            }
-            QAbstractScrollArea::corner {
-                background: transparent;
-            }
-            QGroupBox {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                margin-top: 8px;
-                padding-top: 8px;
-                background: %(bg_panel)s;
-            }
-            QGroupBox::title {
-                left: 10px;
-                padding: 0 4px;
-                color: %(text_secondary)s;
-                background: transparent;
-            }
-            QTabWidget::pane {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 10px;
-                background: %(bg_panel)s;
-                top: -1px;
-            }
-            QTabBar::tab {
-                background: %(bg_card)s;
-                border: 1px solid %(border_subtle)s;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                color: %(text_secondary)s;
-                min-width: 90px;
-                padding: 6px 12px;
-                margin-right: 4px;
-            }
-            QTabBar::tab:hover {
-                color: %(text_primary)s;
-                border-color: %(border_focus)s;
-            }
-            QTabBar::tab:selected {
-                color: %(text_primary)s;
-                border-color: %(accent_subtle_hover)s;
-                background: %(bg_hover)s;
-            }
-            QLineEdit, QComboBox, QDateEdit, QSpinBox, QDoubleSpinBox, QPlainTextEdit, QTableWidget {
-                border: 1px solid transparent;
-                border-radius: 8px;
-                background: %(bg_card)s;
-                color: %(text_primary)s;
-                padding: 4px 6px;
-            }
-            QLineEdit:focus, QComboBox:focus, QDateEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QPlainTextEdit:focus, QTableWidget:focus {
-                border: 1px solid %(accent)s;
-            }
-            QTableWidget::item:selected {
-                background: %(accent_soft_hover)s;
-                color: %(text_primary)s;
-            }
-            QHeaderView::section {
-                background: %(bg_card)s;
-                color: %(text_secondary)s;
-                border: none;
-                border-bottom: 1px solid %(border_subtle)s;
-                padding: 6px;
-            }
-            QProgressBar {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 7px;
-                background: %(bg_card)s;
-                color: %(text_secondary)s;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: %(accent_subtle_hover)s;
-                border-radius: 6px;
-            }
-            QPushButton {
-                border: 1px solid %(border_subtle)s;
-                border-radius: 8px;
-                background: %(bg_card)s;
-                color: %(text_primary)s;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background: %(bg_hover)s;
-                border-color: %(border_focus)s;
-            }
-            QPushButton:pressed {
-                background: %(bg_panel)s;
-            }
-            QPushButton[isPrimaryButton="true"] {
-                background: %(accent_subtle_soft)s;
-                border-color: %(accent_subtle)s;
-                color: %(text_primary)s;
-                font-weight: 600;
-            }
-            QPushButton[isPrimaryButton="true"]:hover {
-                background: %(accent_subtle_soft_hover)s;
-                border-color: %(accent_subtle_hover)s;
-            }
-            QPushButton[isPrimaryButton="true"]:pressed {
-                background: %(accent_subtle_soft)s;
-                border-color: %(accent_subtle_pressed)s;
-                color: %(text_primary)s;
-            }
-            QPushButton:disabled {
-                background: %(bg_panel)s;
-                border-color: %(border_subtle)s;
-                color: %(text_muted)s;
-            }
-            QPushButton[isPrimaryButton="true"]:disabled {
-                background: %(bg_panel)s;
-                border-color: %(border_subtle)s;
-                color: %(text_muted)s;
-            }
-            """
-            % {
-                "accent": accent,
-                "accent_hover": accent_hover,
-                "accent_pressed": accent_pressed,
-                "accent_muted": accent_muted,
-                "accent_soft": accent_soft,
-                "accent_soft_hover": accent_soft_hover,
-                "accent_subtle": accent_subtle,
-                "accent_subtle_hover": accent_subtle_hover,
-                "accent_subtle_pressed": accent_subtle_pressed,
-                "accent_subtle_soft": accent_subtle_soft,
-                "accent_subtle_soft_hover": accent_subtle_soft_hover,
-                "bg_app": bg_app,
-                "bg_panel": bg_panel,
-                "bg_card": bg_card,
-                "bg_hover": bg_hover,
-                "border_subtle": border_subtle,
-                "border_focus": border_focus,
-                "text_primary": text_primary,
-                "text_secondary": text_secondary,
-                "text_muted": text_muted,
-                "scrollbar_track": scrollbar_track,
-                "scrollbar_handle": scrollbar_handle,
-                "scrollbar_handle_hover": scrollbar_handle_hover,
-                "scrollbar_handle_pressed": scrollbar_handle_pressed,
-            }
+        self.rename_service = runtime.rename_service
+
+        # Tabs not built yet pick up the new services from their factories.
+        self.dashboard_tab.project_service = self.project_service
+        if self.hub_tab is not None:
+            self.hub_tab.project_service = self.project_service
+            self.hub_tab.preset_service = self.preset_service
+        if self.rename_tab is not None:
+            self.rename_tab.project_service = self.project_service
+            self.rename_tab.culling_service = self.culling_service
+            self.rename_tab.rename_service = self.rename_service
+        if self.import_export_tab is not None:
+            self.import_export_tab.import_tab.project_service = self.project_service
+            self.import_export_tab.import_tab.import_service = self.import_service
+            self.import_export_tab.culling_tab.project_service = self.project_service
+            self.import_export_tab.culling_tab.culling_service = self.culling_service
+            self.import_export_tab.edit_tab.project_service = self.project_service
+            self.import_export_tab.edit_tab.edit_service = self.edit_service
+            self.import_export_tab.edit_tab.metadata_service = self.metadata_service
+            self.import_export_tab.export_tab.project_service = self.project_service
+            self.import_export_tab.export_tab.preset_service = self.preset_service
+            self.import_export_tab.export_tab.export_service = self.export_service
+            self.import_export_tab.export_tab.job_queue_service = self.job_queue_service
+        if self.presets_tab is not None:
+            self.presets_tab.preset_service = self.preset_service
+        self._set_shell_enabled(True)
+        self._on_operation_ended()
+        self._append_job_event("Migration stockage terminee et runtime recharge.")
+        self.refresh_all_now()
+
+    def refresh_all(self, scope: set[str] | None = None, project_id: int | None = None) -> None:
+        # Any data change makes the shared project list stale right away.
+        self._project_cache.invalidate()
+        # scope={"assets"} with a project id means only that project's assets
+        # (and possibly its status) changed; anything else refreshes every tab.
+        if scope is not None and scope <= {"assets"} and project_id is not None:
+            self._asset_refresh_ids.add(int(project_id))
+        else:
+            self._full_refresh_pending = True
+        # Coalesce bursts of on_data_changed callbacks into a single refresh.
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def refresh_all_now(self) -> None:
+        self._refresh_timer.stop()
+        self._full_refresh_pending = False
+        self._asset_refresh_ids = set()
+        self._project_cache.invalidate()
+        self._refresh_seq += 1
+        self._await_projects(self.import_export_tab, self.rename_tab)
+        self._refresh_status_views()
+        self._apply_refresh_snapshot(self._load_refresh_snapshot(self._refresh_seq))
+
+    def _do_refresh_all(self) -> None:
+        # The project/preset queries run off the GUI thread; a newer refresh
+        # bumps _refresh_seq so a stale snapshot is dropped on arrival.
+        self._refresh_seq += 1
+        self._project_cache.invalidate()
+        if self._full_refresh_pending:
+            # Combo-filling tabs are repopulated from the snapshot below, so
+            # list_projects() never runs on the GUI thread here.
+            self._await_projects(self.import_export_tab, self.rename_tab)
+            self._refresh_status_views()
+        else:
+            self._refresh_asset_views(self._asset_refresh_ids)
+        self._full_refresh_pending = False
+        self._asset_refresh_ids = set()
+        # Project rows (status, counts) feed the dashboard/hub either way.
+        self._async_fetch(
+            self._load_refresh_snapshot,
+            self._apply_refresh_snapshot,
+            self._refresh_seq,
+            on_error=self._on_refresh_snapshot_error,
         )
 
+    def _await_projects(self, *tabs: QWidget | None) -> None:
+        for tab in tabs:
+            if tab is not None and tab not in self._tabs_awaiting_projects:
+                self._tabs_awaiting_projects.append(tab)
+
+    def _refresh_project_tabs(self, projects: list) -> None:
+        tabs = self._tabs_awaiting_projects
+        self._tabs_awaiting_projects = []
+        for tab in tabs:
+            tab.refresh_data(projects)
+
+    def _refresh_status_views(self) -> None:
+        if self.settings_tab is not None:
+            self.settings_tab.refresh_data()
+        self.jobs_tab.refresh_data()
+        self._update_activity_badge()
+
+    def _refresh_asset_views(self, project_ids: set[int]) -> None:
+        # Project names are unchanged, so combos stay as they are and only the
+        # views showing one of these projects reload their assets.
+        if self.import_export_tab is not None:
+            self.import_export_tab.refresh_project_assets(project_ids)
+        if self.rename_tab is not None and self.rename_tab.project_combo.currentData() in project_ids:
+            self._await_projects(self.rename_tab)
+        self.jobs_tab.refresh_data()
+        self._update_activity_badge()
+
+    def _load_refresh_snapshot(self, seq: int, **_job_kwargs) -> tuple[int, list, list]:
+        return seq, self.project_service.list_projects(), self.preset_service.list_presets()
+
+    def _apply_refresh_snapshot(self, snapshot: tuple[int, list, list]) -> None:
+        seq, projects, presets = snapshot
+        if seq != self._refresh_seq:
+            return
+        if not self._refresh_timer.isActive():
+            # No change queued since this snapshot was taken; reuse it.
+            self._project_cache.prime(projects)
+        self._refresh_project_tabs(projects)
+        # One snapshot of projects/presets is shared by every consumer below.
+        self.dashboard_tab.refresh_data(projects)
+        if self.hub_tab is not None:
+            self.hub_tab.refresh_data(projects, presets)
+        if self.presets_tab is not None:
+            self.presets_tab.refresh_data(presets)
+        self._refresh_project_context_combo(projects)
+
+    def _async_fetch(self, fn, on_ready, *args, on_error=None) -> None:
+        # Short reads share the global pool. Long jobs (import, culling batch,
+        # export) run on _job_thread_pool(); only rename and edit sync still
+        # use a dedicated QThread.
+        # on_ready/on_error must be bound slots of a GUI-thread QObject so the
+        # queued result is delivered on the main thread.
+        worker = JobWorker(fn, *args)
+        self._fetch_workers.add(worker)
+        worker.result.connect(on_ready, Qt.ConnectionType.QueuedConnection)
+        worker.error.connect(on_error or self._on_async_fetch_error, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(self._on_async_fetch_finished, Qt.ConnectionType.QueuedConnection)
+        self._thread_pool.start(worker.run)
+
+    def _on_refresh_snapshot_error(self, message: str) -> None:
+        self._on_async_fetch_error(message)
+        # Don't leave combos stale: fall back to a synchronous listing.
+        if self._tabs_awaiting_projects:
+            self._refresh_project_tabs(self._project_cache.get_projects())
+
+    def _on_async_fetch_error(self, message: str) -> None:
+        self._append_job_event(f"[Refresh] Erreur: {message}")
+
+    def _on_async_fetch_finished(self) -> None:
+        self._fetch_workers.discard(self.sender())
+
+    def _apply_sprint1_style(self) -> None:
+        stylesheet = _build_sprint1_stylesheet(normalize_accent_color(self.accent_color))
+        app = QApplication.instance()
+        # Re-applying an identical stylesheet would still repolish every widget.
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
+
 
 class HubTab(QWidget):
     def __init__(self, project_service: ProjectService, preset_service: PresetService, on_data_changed) -> None:
@@ -1672,6 +2155,7 @@ class HubTab(QWidget):
         self.preset_service = preset_service
         self.on_data_changed = on_data_changed
         self._name_filter = ""
+        self._location_dialog: QFileDialog | None = None
 
         layout = QVBoxLayout(self)
 
@@ -1735,7 +2219,9 @@ class HubTab(QWidget):
         status_box = QGroupBox("Statut Projet")
         status_layout = QHBoxLayout(status_box)
         self.status_combo = QComboBox()
+        self._status_index: dict[str, int] = {}
         for code, label in self.project_service.list_status_choices():
+            self._status_index[code] = self.status_combo.count()
             self.status_combo.addItem(label, userData=code)
         self.status_btn = _new_button("Mettre a jour le statut")
         self.status_btn.clicked.connect(self._update_selected_project_status)
@@ -1789,6 +2275,12 @@ class HubTab(QWidget):
 
         self.current_project_id: int | None = None
         self.expanded_project_ids: set[int] = set()
+        self._rendered_signature: tuple | None = None
+        self._preset_sig: tuple | None = None
+        self._assign_index: dict[int | None, int] = {None: 0}
+        self._visible_rows: tuple[ProjectCardRow, ...] = ()
+        self._row_by_project_id: dict[int, ProjectCardRow] = {}
+        self._project_cards: dict[int, tuple[ProjectCardRow, QFrame, QToolButton, QWidget]] = {}
         projects_box = QGroupBox("Projets")
         projects_box_layout = QVBoxLayout(projects_box)
         self.project_cards_area = QScrollArea()
@@ -1804,79 +2296,126 @@ class HubTab(QWidget):
         projects_box_layout.addWidget(self.project_cards_area)
         layout.addWidget(projects_box, 1)
 
-    def refresh_data(self) -> None:
+    def refresh_data(self, projects: list | None = None, presets: list | None = None) -> None:
         selected_project_id = self._selected_project_id()
-        presets = self.preset_service.list_presets()
-        self.preset_combo.blockSignals(True)
-        self.assign_combo.blockSignals(True)
-        self.preset_combo.clear()
-        self.assign_combo.clear()
-        self.preset_combo.addItem("Aucun preset", userData=None)
-        self.assign_combo.addItem("Aucun preset", userData=None)
-        for preset in presets:
-            self.preset_combo.addItem(preset.name, userData=preset.id)
-            self.assign_combo.addItem(preset.name, userData=preset.id)
-        self.preset_combo.blockSignals(False)
-        self.assign_combo.blockSignals(False)
-
-        projects = self.project_service.list_projects()
-        filtered_projects = projects
+        if presets is None:
+            presets = self.preset_service.list_presets()
+        preset_sig = tuple((preset.id, preset.name) for preset in presets)
+        if preset_sig != self._preset_sig:
+            self._preset_sig = preset_sig
+            self.preset_combo.blockSignals(True)
+            self.assign_combo.blockSignals(True)
+            self.preset_combo.clear()
+            self.assign_combo.clear()
+            self.preset_combo.addItem("Aucun preset", userData=None)
+            self.assign_combo.addItem("Aucun preset", userData=None)
+            self._assign_index = {None: 0}
+            for preset_id, preset_name in preset_sig:
+                self.preset_combo.addItem(preset_name, userData=preset_id)
+                self._assign_index[preset_id] = self.assign_combo.count()
+                self.assign_combo.addItem(preset_name, userData=preset_id)
+            self.preset_combo.blockSignals(False)
+            self.assign_combo.blockSignals(False)
+
+        if projects is None:
+            projects = self.project_service.list_projects()
+        rows = _build_project_card_rows(projects, self.project_service.get_status_label)
         if self._name_filter:
             term = self._name_filter.lower()
-            filtered_projects = [
-                project
-                for project in projects
-                if term
-                in " ".join(
-                    [
-                        project.name,
-                        project.client.name if project.client else "",
-                        self.project_service.get_status_label(project.status),
-                    ]
-                ).lower()
-            ]
-        visible_ids = {project.id for project in filtered_projects}
+            rows = [row for row in rows if term in row.search_text]
+        visible_ids = {row.id for row in rows}
         if selected_project_id not in visible_ids:
-            selected_project_id = filtered_projects[0].id if filtered_projects else None
+            selected_project_id = rows[0].id if rows else None
             self.current_project_id = selected_project_id
 
-        self._render_project_cards(filtered_projects)
+        self._visible_rows = tuple(rows)
+        self._row_by_project_id = {row.id: row for row in self._visible_rows}
+        self._render_project_cards(self._visible_rows)
         self._sync_controls_with_selected_project()
 
     def set_name_filter(self, value: str) -> None:
-        self._name_filter = value.strip()
+        value = value.strip()
+        if value == self._name_filter:
+            return
+        self._name_filter = value
         self.refresh_data()
 
     def select_project_by_id(self, project_id: int) -> None:
-        self.current_project_id = int(project_id)
-        self.refresh_data()
+        project_id = int(project_id)
+        if project_id not in self._row_by_project_id:
+            self.current_project_id = project_id
+            self.refresh_data()
+            return
+        if project_id == self.current_project_id:
+            return
+        self.current_project_id = project_id
+        self._render_project_cards(self._visible_rows)
+        self._sync_controls_with_selected_project()
 
     def _selected_project_id(self) -> int | None:
         return self.current_project_id
 
-    def _clear_project_cards(self) -> None:
+    def _render_project_cards(self, rows: tuple[ProjectCardRow, ...]) -> None:
+        signature = (rows, self.current_project_id)
+        if signature == self._rendered_signature:
+            return
+        self._rendered_signature = signature
+        self.project_cards_content.setUpdatesEnabled(False)
+        try:
+            self._fill_project_cards(rows)
+        finally:
+            self.project_cards_content.setUpdatesEnabled(True)
+
+    def _fill_project_cards(self, rows: tuple[ProjectCardRow, ...]) -> None:
+        # Cards whose row is unchanged are kept and only their selection state
+        # is updated; the others are rebuilt.
+        wanted = {row.id: row for row in rows}
+        for project_id, (cached_row, card, _toggle, _details) in list(self._project_cards.items()):
+            if wanted.get(project_id) != cached_row:
+                del self._project_cards[project_id]
+                card.deleteLater()
+        kept = {entry[1] for entry in self._project_cards.values()}
         while self.project_cards_layout.count():
             item = self.project_cards_layout.takeAt(0)
             widget = item.widget()
-            if widget is not None:
+            if widget is not None and widget not in kept:
                 widget.deleteLater()
 
-    def _render_project_cards(self, projects: list) -> None:
-        self._clear_project_cards()
-        if not projects:
+        if not rows:
             empty = QLabel("Aucun projet pour ce filtre.")
             empty.setObjectName("CardMuted")
             self.project_cards_layout.addWidget(empty)
             self.project_cards_layout.addStretch(1)
             return
 
-        for project in projects:
-            is_selected = self.current_project_id is not None and int(project.id) == int(self.current_project_id)
-            card = self._build_project_card(project, is_selected=is_selected)
+        for row in rows:
+            is_selected = self.current_project_id is not None and row.id == int(self.current_project_id)
+            entry = self._project_cards.get(row.id)
+            if entry is None:
+                card, toggle, details = self._build_project_card(row, is_selected=is_selected)
+                self._project_cards[row.id] = (row, card, toggle, details)
+            else:
+                _row, card, toggle, details = entry
+                self._apply_card_selection(row.id, card, toggle, details, is_selected)
             self.project_cards_layout.addWidget(card)
         self.project_cards_layout.addStretch(1)
 
-    def _build_project_card(self, project, is_selected: bool) -> QWidget:
+    def _apply_card_selection(
+        self, project_id: int, card: QFrame, toggle: QToolButton, details: QWidget, is_selected: bool
+    ) -> None:
+        selected = "true" if is_selected else "false"
+        if card.property("selected") != selected:
+            card.setProperty("selected", selected)
+            card.style().unpolish(card)
+            card.style().polish(card)
+        expanded = bool(is_selected or (project_id in self.expanded_project_ids))
+        toggle.blockSignals(True)
+        toggle.setChecked(expanded)
+        toggle.blockSignals(False)
+        toggle.setArrowType(Qt.ArrowType.DownArrow if expanded else Qt.ArrowType.RightArrow)
+        details.setVisible(expanded)
+
+    def _build_project_card(self, row: ProjectCardRow, is_selected: bool) -> tuple[QFrame, QToolButton, QWidget]:
         card = QFrame()
         card.setObjectName("DataCard")
         card.setProperty("selected", "true" if is_selected else "false")
@@ -1887,20 +2426,20 @@ class HubTab(QWidget):
         header = QHBoxLayout()
         header.setContentsMargins(0, 0, 0, 0)
         header.setSpacing(10)
-        select_btn = NativePushButton(f"{project.id} - {project.name}")
+        select_btn = NativePushButton(f"{row.id} - {row.name}")
         select_btn.setProperty("cardSelect", "true")
         select_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         select_btn.setMinimumHeight(32)
         select_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        select_btn.clicked.connect(lambda _checked=False, pid=project.id: self._on_project_card_selected(pid))
-        badge = QLabel(self.project_service.get_status_label(project.status))
+        select_btn.clicked.connect(lambda _checked=False, pid=row.id: self._on_project_card_selected(pid))
+        badge = QLabel(row.status_label)
         badge.setObjectName("CardBadge")
         badge.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
         toggle = QToolButton()
         toggle.setProperty("cardToggle", "true")
         toggle.setCheckable(True)
-        expanded = bool(is_selected or (project.id in self.expanded_project_ids))
+        expanded = bool(is_selected or (row.id in self.expanded_project_ids))
         toggle.setChecked(expanded)
         toggle.setArrowType(Qt.ArrowType.DownArrow if expanded else Qt.ArrowType.RightArrow)
         toggle.setFixedSize(24, 24)
@@ -1918,14 +2457,14 @@ class HubTab(QWidget):
         details_layout.setVerticalSpacing(6)
         details_layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.AllNonFixedFieldsGrow)
         details_layout.setRowWrapPolicy(QFormLayout.RowWrapPolicy.WrapAllRows)
-        details_layout.addRow("Client", self._card_value(project.client.name if project.client else "-"))
-        details_layout.addRow("Date", self._card_value(project.shoot_date.strftime("%Y-%m-%d")))
-        details_layout.addRow("Preset", self._card_value(project.preset.name if project.preset else "-"))
-        details_layout.addRow("Dossier", self._card_value(project.root_path))
+        details_layout.addRow("Client", self._card_value(row.client_name))
+        details_layout.addRow("Date", self._card_value(row.shoot_date))
+        details_layout.addRow("Preset", self._card_value(row.preset_name))
+        details_layout.addRow("Dossier", self._card_value(row.root_path))
         details.setVisible(expanded)
         card_layout.addWidget(details)
 
-        def _on_toggle(opened: bool, pid=project.id, panel=details, btn=toggle):
+        def _on_toggle(opened: bool, pid=row.id, panel=details, btn=toggle):
             panel.setVisible(opened)
             btn.setArrowType(Qt.ArrowType.DownArrow if opened else Qt.ArrowType.RightArrow)
             if opened:
@@ -1934,7 +2473,7 @@ class HubTab(QWidget):
                 self.expanded_project_ids.discard(pid)
 
         toggle.toggled.connect(_on_toggle)
-        return card
+        return card, toggle, details
 
     @staticmethod
     def _card_value(value: str) -> QLabel:
@@ -1944,17 +2483,17 @@ class HubTab(QWidget):
         return label
 
     def _on_project_card_selected(self, project_id: int) -> None:
-        self.current_project_id = int(project_id)
-        self.refresh_data()
+        self.select_project_by_id(project_id)
 
     def _toggle_custom_location(self, enabled: bool) -> None:
         self.custom_location_edit.setEnabled(enabled)
         self.custom_location_browse_btn.setEnabled(enabled)
 
     def _pick_custom_location(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Choisir dossier parent")
-        if directory:
-            self.custom_location_edit.setText(directory)
+        if self._location_dialog is None:
+            self._location_dialog = _new_directory_dialog(self, "Choisir dossier parent")
+        if self._location_dialog.exec() and self._location_dialog.selectedFiles():
+            self.custom_location_edit.setText(self._location_dialog.selectedFiles()[0])
 
     def _create_project(self) -> None:
         name = self.name_edit.text().strip()
@@ -2030,12 +2569,12 @@ class HubTab(QWidget):
             self._set_quality_snapshot(None)
             return
 
-        status_idx = self.status_combo.findData(project.status)
+        status_idx = self._status_index.get(project.status, -1)
         if status_idx >= 0:
             self.status_combo.setCurrentIndex(status_idx)
 
         target_preset_id = project.preset_id
-        assign_idx = self.assign_combo.findData(target_preset_id)
+        assign_idx = self._assign_index.get(target_preset_id, -1)
         if assign_idx >= 0:
             self.assign_combo.setCurrentIndex(assign_idx)
         self._refresh_quality_snapshot(project_id)
@@ -2220,6 +2759,7 @@ class BatchRenameTab(QWidget):
         controls_layout.setVerticalSpacing(8)
 
         self.project_combo = QComboBox()
+        self._project_index: dict[int, int] = {}
         self.project_combo.currentIndexChanged.connect(self._on_project_changed)
 
         self.rejected_mode_combo = QComboBox()
@@ -2323,23 +2863,17 @@ class BatchRenameTab(QWidget):
         split.setSizes([900, 620])
         layout.addWidget(split, 1)
 
-    def refresh_data(self) -> None:
-        current_project_id = self.project_combo.currentData()
-        self.project_combo.blockSignals(True)
-        self.project_combo.clear()
-        for project in self.project_service.list_projects():
-            self.project_combo.addItem(f"{project.id} - {project.name}", userData=project.id)
-        if current_project_id is not None:
-            idx = self.project_combo.findData(current_project_id)
-            if idx >= 0:
-                self.project_combo.setCurrentIndex(idx)
-        self.project_combo.blockSignals(False)
+    def refresh_data(self, projects: list | None = None) -> None:
+        self._project_index = _fill_project_combo(
+            self.project_combo,
+            self.project_service,
+            limit=None,
+            projects=projects,
+        )
         self._on_project_changed()
 
     def set_selected_project(self, project_id: int) -> None:
-        idx = self.project_combo.findData(int(project_id))
-        if idx >= 0:
-            self.project_combo.setCurrentIndex(idx)
+        _select_project_in_combo(self.project_combo, self._project_index, self.project_service, project_id)
 
     def _on_project_changed(self) -> None:
         self._sync_pattern_from_project()
@@ -2660,11 +3194,21 @@ class ImportExportTab(QWidget):
         self.sections.addTab(self.export_tab, "Export")
         layout.addWidget(self.sections)
 
-    def refresh_data(self) -> None:
-        self.import_tab.refresh_data()
-        self.culling_tab.refresh_data()
-        self.edit_tab.refresh_data()
-        self.export_tab.refresh_data()
+    def refresh_data(self, projects: list | None = None) -> None:
+        if projects is None:
+            projects = self.import_tab.project_service.list_projects()
+        self.import_tab.refresh_data(projects)
+        self.culling_tab.refresh_data(projects)
+        self.edit_tab.refresh_data(projects)
+        self.export_tab.refresh_data(projects)
+
+    def refresh_project_assets(self, project_ids: set[int]) -> None:
+        if self.culling_tab.project_combo.currentData() in project_ids:
+            self.culling_tab._load_assets()
+        if self.edit_tab.project_combo.currentData() in project_ids:
+            self.edit_tab._load_assets()
+        if self.export_tab.project_combo.currentData() in project_ids:
+            self.export_tab._sync_export_context()
 
     def set_current_section(self, section: str) -> None:
         normalized = (section or "").strip().lower()
@@ -2705,8 +3249,9 @@ class ImportTab(QWidget):
         self.on_operation_started = on_operation_started
         self.on_operation_ended = on_operation_ended
         self.on_job_event = on_job_event or (lambda _message: None)
-        self._job_thread: QThread | None = None
         self._job_worker: JobWorker | None = None
+        self._job_project_id: int | None = None
+        self._source_dialog: QFileDialog | None = None
 
         layout = QVBoxLayout(self)
 
@@ -2714,6 +3259,13 @@ class ImportTab(QWidget):
         controls_layout = QFormLayout(controls)
 
         self.project_combo = QComboBox()
+        self._project_index: dict[int, int] = {}
+        self.project_search_edit = _new_project_search_edit()
+        self._project_search_timer = _new_search_debounce(self, self._apply_project_search)
+        self.project_search_edit.textChanged.connect(self._project_search_timer.start)
+        project_row = QHBoxLayout()
+        project_row.addWidget(self.project_search_edit)
+        project_row.addWidget(self.project_combo, 1)
 
         source_row = QHBoxLayout()
         self.source_edit = QLineEdit()
@@ -2738,7 +3290,7 @@ class ImportTab(QWidget):
         self.progress_bar.setMaximum(100)
         self.progress_bar.setValue(0)
 
-        controls_layout.addRow("Projet", self.project_combo)
+        controls_layout.addRow("Projet", project_row)
         controls_layout.addRow("Source", source_row)
         controls_layout.addRow("", run_row)
         controls_layout.addRow("Progression", self.progress_bar)
@@ -2749,30 +3301,30 @@ class ImportTab(QWidget):
         self.log_text.setReadOnly(True)
         layout.addWidget(self.log_text)
 
-    def refresh_data(self) -> None:
-        current = self.project_combo.currentData()
-        self.project_combo.blockSignals(True)
-        self.project_combo.clear()
-        for project in self.project_service.list_projects():
-            self.project_combo.addItem(f"{project.id} - {project.name}", userData=project.id)
-        if current is not None:
-            idx = self.project_combo.findData(current)
-            if idx >= 0:
-                self.project_combo.setCurrentIndex(idx)
-        self.project_combo.blockSignals(False)
+    def refresh_data(self, projects: list | None = None) -> None:
+        self._project_index = _fill_project_combo(
+            self.project_combo,
+            self.project_service,
+            self.project_search_edit.text(),
+            projects=projects,
+        )
 
     def set_selected_project(self, project_id: int) -> None:
-        idx = self.project_combo.findData(project_id)
-        if idx >= 0:
-            self.project_combo.setCurrentIndex(idx)
+        _select_project_in_combo(self.project_combo, self._project_index, self.project_service, project_id)
+
+    def _apply_project_search(self) -> None:
+        self._project_index = _fill_project_combo(
+            self.project_combo, self.project_service, self.project_search_edit.text()
+        )
 
     def _pick_source(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Choisir dossier source")
-        if directory:
-            self.source_edit.setText(directory)
+        if self._source_dialog is None:
+            self._source_dialog = _new_directory_dialog(self, "Choisir dossier source")
+        if self._source_dialog.exec() and self._source_dialog.selectedFiles():
+            self.source_edit.setText(self._source_dialog.selectedFiles()[0])
 
     def _run_import(self) -> None:
-        if self._job_thread is not None:
+        if self._job_worker is not None:
             QMessageBox.warning(self, "Operation en cours", "Un import est deja en cours.")
             return
         project_id = self.project_combo.currentData()
@@ -2791,19 +3343,14 @@ class ImportTab(QWidget):
         self.on_job_event(f"[Import] Lancement du job pour projet ID {project_id}.")
 
         worker = JobWorker(self.import_service.run_import, project_id=project_id, source_dir=source)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        worker.progress.connect(self._on_import_progress)
-        worker.result.connect(self._on_import_result)
-        worker.error.connect(self._on_import_error)
-        worker.finished.connect(self._on_import_finished)
-        worker.finished.connect(thread.quit)
-        thread.finished.connect(thread.deleteLater)
+        worker.progress.connect(self._on_import_progress, Qt.ConnectionType.QueuedConnection)
+        worker.result.connect(self._on_import_result, Qt.ConnectionType.QueuedConnection)
+        worker.error.connect(self._on_import_error, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(self._on_import_finished, Qt.ConnectionType.QueuedConnection)
 
         self._job_worker = worker
-        self._job_thread = thread
-        thread.start()
+        self._job_project_id = int(project_id)
+        _job_thread_pool().start(worker.run)
 
     def _cancel_import(self) -> None:
         if self._job_worker is not None:
@@ -2826,7 +3373,7 @@ class ImportTab(QWidget):
         self.on_job_event(
             f"[Import] {result.status} | total={result.total}, copied={result.copied}, failed={result.failed}"
         )
-        self.on_data_changed()
+        self.on_data_changed(scope={"assets"}, project_id=self._job_project_id)
 
     def _on_import_error(self, message: str) -> None:
         self.on_job_event(f"[Import] Erreur: {message}")
@@ -2837,10 +3384,68 @@ class ImportTab(QWidget):
         self.cancel_btn.setEnabled(False)
         self.on_operation_ended()
         self._job_worker = None
-        self._job_thread = None
         self.on_job_event("[Import] Job termine.")
 
 
+def _read_scaled_image(
+    path: Path,
+    bound: QSize | None,
+    mode: Qt.AspectRatioMode = Qt.AspectRatioMode.KeepAspectRatio,
+) -> tuple[QImage, QSize | None]:
+    """Decode ``path`` within ``bound``; also return the original size, as displayed."""
+    # Let the codec decimate while decoding (libjpeg scaled DCT) instead of
+    # decoding at full resolution and throwing most pixels away.
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    source = reader.size()
+    if not source.isValid():
+        return reader.read(), None
+    if bound is not None and (source.width() > bound.width() or source.height() > bound.height()):
+        reader.setScaledSize(source.scaled(bound, mode))
+    oriented = source
+    if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+        oriented = source.transposed()
+    return reader.read(), oriented
+
+
+def _decode_preview_image(
+    resolved: Path,
+    prefetch_manager: PreviewPrefetchManager | None,
+    bound: QSize | None = None,
+) -> tuple[QImage, QSize | None]:
+    # QImage (not QPixmap) so the decode is safe off the GUI thread. The
+    # source size is only known when the original file itself is decoded.
+    image = QImage()
+    if prefetch_manager is not None:
+        warm_bytes = prefetch_manager.get_warmed_preview_bytes(resolved)
+        if warm_bytes:
+            image.loadFromData(warm_bytes)
+        if image.isNull():
+            cached_path = prefetch_manager.get_cached_preview_path(resolved)
+            if cached_path is not None and cached_path.exists():
+                image = QImage(str(cached_path))
+    if image.isNull():
+        return _read_scaled_image(resolved, bound)
+    return image, None
+
+
+def _load_preview_image(
+    key: str,
+    resolved: Path,
+    prefetch_manager: PreviewPrefetchManager | None,
+    bound: QSize | None = None,
+    *,
+    is_cancelled=None,
+    **_job_kwargs,
+) -> tuple[str, QImage | None, bool, QSize | None]:
+    if is_cancelled is not None and is_cancelled():
+        return (key, None, False, None)
+    image, source_size = _decode_preview_image(resolved, prefetch_manager, bound)
+    # Existence is only checked off the GUI thread, and only when decoding failed.
+    missing = image.isNull() and not resolved.exists()
+    return (key, image, missing, source_size)
+
+
 class CullingTab(QWidget):
     def __init__(
         self,
@@ -2859,8 +3464,9 @@ class CullingTab(QWidget):
         self.on_operation_ended = on_operation_ended
         self.on_job_event = on_job_event or (lambda _message: None)
         self._shortcut_refs: list[QShortcut] = []
-        self._job_thread: QThread | None = None
+        self._rating_shortcuts: dict[QShortcut, int] = {}
         self._job_worker: JobWorker | None = None
+        self._job_project_id: int | None = None
         self.focus_mode_enabled = False
         self.asset_card_widgets: dict[int, QFrame] = {}
         self.show_path_overlay = False
@@ -2869,8 +3475,27 @@ class CullingTab(QWidget):
         self._filmstrip_window: tuple[int, int] = (0, -1)
         self._preview_cache: dict[str, QPixmap] = {}
         self._preview_cache_order: list[str] = []
+        # Original dimensions of cached previews (the pixmaps are screen-bounded).
+        self._preview_source_sizes: dict[str, QSize] = {}
         self._thumb_cache: dict[str, QPixmap] = {}
         self._thumb_cache_order: list[str] = []
+        # Scaled previews live in the global QPixmapCache; give it room for a
+        # few full-screen HiDPI previews.
+        if QPixmapCache.cacheLimit() < 65536:
+            QPixmapCache.setCacheLimit(65536)
+        self._smooth_preview_timer = QTimer(self)
+        self._smooth_preview_timer.setSingleShot(True)
+        self._smooth_preview_timer.setInterval(150)
+        self._smooth_preview_timer.timeout.connect(self._apply_smooth_preview)
+        self._preview_workers: dict[str, JobWorker] = {}
+        self._pending_preview: tuple[Path, str] | None = None
+        self._preview_debounce = QTimer(self)
+        self._preview_debounce.setSingleShot(True)
+        self._preview_debounce.setInterval(80)
+        self._preview_debounce.timeout.connect(self._start_pending_preview)
+        self._resolved_paths: dict[str, Path] = {}
+        self._resolved_paths_project_id: int | None = None
+        self._wanted_preview_key: str | None = None
         self._prefetch_manager: PreviewPrefetchManager | None = None
         try:
             cache_root = Path(self.project_service.paths.data_dir) / "cache" / "images"
@@ -2890,7 +3515,14 @@ class CullingTab(QWidget):
         controls_layout.setVerticalSpacing(6)
 
         self.project_combo = QComboBox()
+        self._project_index: dict[int, int] = {}
         self.project_combo.currentIndexChanged.connect(self._load_assets)
+        self.project_search_edit = _new_project_search_edit()
+        self._project_search_timer = _new_search_debounce(self, self._apply_project_search)
+        self.project_search_edit.textChanged.connect(self._project_search_timer.start)
+        project_row = QHBoxLayout()
+        project_row.addWidget(self.project_search_edit)
+        project_row.addWidget(self.project_combo, 1)
 
         self.rejected_mode_combo = QComboBox()
         self.rejected_mode_combo.addItem("Tout", userData="all")
@@ -2994,7 +3626,7 @@ class CullingTab(QWidget):
         quick_row.addWidget(self.batch_toggle_btn)
         quick_row.addStretch(1)
 
-        controls_layout.addRow("Projet", self.project_combo)
+        controls_layout.addRow("Projet", project_row)
         controls_layout.addRow("", filter_row)
         controls_layout.addRow("", advanced_filter_row)
         controls_layout.addRow("", quick_row)
@@ -3184,9 +3816,13 @@ class CullingTab(QWidget):
         return super().eventFilter(obj, event)
 
     def _build_shortcuts(self) -> None:
+        if self._shortcut_refs:
+            return
+        # All rating keys share one slot; the rating is looked up per sender.
         for rating in range(0, 6):
             shortcut = QShortcut(QKeySequence(str(rating)), self)
-            shortcut.activated.connect(lambda r=rating: self._set_selected_rating(r))
+            shortcut.activated.connect(self._on_rating_shortcut)
+            self._rating_shortcuts[shortcut] = rating
             self._shortcut_refs.append(shortcut)
 
         reject_shortcut = QShortcut(QKeySequence("R"), self)
@@ -3225,23 +3861,30 @@ class CullingTab(QWidget):
         info_shortcut.activated.connect(self._toggle_overlay_shortcut)
         self._shortcut_refs.append(info_shortcut)
 
-    def refresh_data(self) -> None:
-        current = self.project_combo.currentData()
-        self.project_combo.blockSignals(True)
-        self.project_combo.clear()
-        for project in self.project_service.list_projects():
-            self.project_combo.addItem(f"{project.id} - {project.name}", userData=project.id)
-        if current is not None:
-            idx = self.project_combo.findData(current)
-            if idx >= 0:
-                self.project_combo.setCurrentIndex(idx)
-        self.project_combo.blockSignals(False)
+    def _on_rating_shortcut(self) -> None:
+        rating = self._rating_shortcuts.get(self.sender())
+        if rating is not None:
+            self._set_selected_rating(rating)
+
+    def refresh_data(self, projects: list | None = None) -> None:
+        self._project_index = _fill_project_combo(
+            self.project_combo,
+            self.project_service,
+            self.project_search_edit.text(),
+            projects=projects,
+        )
         self._load_assets()
 
     def set_selected_project(self, project_id: int) -> None:
-        idx = self.project_combo.findData(project_id)
-        if idx >= 0:
-            self.project_combo.setCurrentIndex(idx)
+        _select_project_in_combo(self.project_combo, self._project_index, self.project_service, project_id)
+
+    def _apply_project_search(self) -> None:
+        previous = self.project_combo.currentData()
+        self._project_index = _fill_project_combo(
+            self.project_combo, self.project_service, self.project_search_edit.text()
+        )
+        if self.project_combo.currentData() != previous:
+            self._load_assets()
 
     def _load_assets(self) -> None:
         project_id = self.project_combo.currentData()
@@ -3278,9 +3921,20 @@ class CullingTab(QWidget):
             shot_date_to=shot_date_to,
         )
 
+        if project_id != self._resolved_paths_project_id:
+            self._resolved_paths = {}
+            self._resolved_paths_project_id = project_id
         current_asset_id = self._selected_asset_id()
+        previous_assets = self.assets_by_id
+        previous_order = self.asset_order
         self.assets_by_id = {int(asset.id): asset for asset in assets}
         self.asset_order = [int(asset.id) for asset in assets]
+        # Only rebuild the filmstrip when the sequence or a source path changed;
+        # rating/reject edits do not affect thumbnails.
+        filmstrip_changed = self.asset_order != previous_order or any(
+            str(getattr(previous_assets.get(asset_id), "src_path", "")) != str(asset.src_path)
+            for asset_id, asset in self.assets_by_id.items()
+        )
         if self._prefetch_manager is not None:
             sequence_paths = [
                 str(asset.src_path)
@@ -3292,7 +3946,7 @@ class CullingTab(QWidget):
             current_asset_id = int(assets[0].id) if assets else None
         self.selected_asset_id = int(current_asset_id) if current_asset_id is not None else None
 
-        self._render_filmstrip(force=True)
+        self._render_filmstrip(force=filmstrip_changed)
         self._set_selected_asset(self.selected_asset_id)
         if self._selected_asset_id() is None:
             self.preview_label.setText("Aucun asset")
@@ -3351,8 +4005,25 @@ class CullingTab(QWidget):
             self._ensure_selected_thumb_visible()
             return
 
-        self._clear_filmstrip()
         self._filmstrip_window = (start, end)
+        self.filmstrip_content.setUpdatesEnabled(False)
+        try:
+            self._fill_filmstrip(start, end)
+        finally:
+            self.filmstrip_content.setUpdatesEnabled(True)
+        self._refresh_filmstrip_selection()
+        self._ensure_selected_thumb_visible()
+
+    def _fill_filmstrip(self, start: int, end: int) -> None:
+        # Detach every layout item, keeping thumbnail buttons for reuse.
+        previous = self.filmstrip_buttons
+        self.filmstrip_buttons = {}
+        while self.filmstrip_layout.count():
+            item = self.filmstrip_layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None and not isinstance(widget, QToolButton):
+                widget.deleteLater()
+
         thumb_w = 136
         thumb_h = 86
         self.filmstrip_content.setMinimumHeight(thumb_h + 20)
@@ -3361,27 +4032,38 @@ class CullingTab(QWidget):
             asset = self.assets_by_id.get(asset_id)
             if asset is None:
                 continue
-            btn = QToolButton()
-            btn.setObjectName("FilmThumb")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
-            btn.setIconSize(QSize(thumb_w, thumb_h))
-            btn.setFixedSize(thumb_w + 18, thumb_h + 18)
+            src_path = str(asset.src_path)
+            btn = previous.pop(asset_id, None)
+            if btn is not None and btn.property("thumbPath") != src_path:
+                btn.deleteLater()
+                btn = None
+            if btn is None:
+                btn = self._build_filmstrip_button(asset_id, src_path, thumb_w, thumb_h)
             btn.setToolTip(asset.file_name)
-            btn.setProperty("selected", "false")
-            btn.clicked.connect(lambda _checked=False, aid=asset_id: self._on_filmstrip_clicked(aid))
-            thumb = self._load_thumb_pixmap(Path(str(asset.src_path)), thumb_w, thumb_h)
-            if thumb.isNull():
-                fallback = QPixmap(thumb_w, thumb_h)
-                fallback.fill(QColor("#2B2B2B"))
-                btn.setIcon(QIcon(fallback))
-            else:
-                btn.setIcon(QIcon(thumb))
             self.filmstrip_buttons[asset_id] = btn
             self.filmstrip_layout.addWidget(btn)
         self.filmstrip_layout.addStretch(1)
-        self._refresh_filmstrip_selection()
-        self._ensure_selected_thumb_visible()
+        for stale in previous.values():
+            stale.deleteLater()
+
+    def _build_filmstrip_button(self, asset_id: int, src_path: str, thumb_w: int, thumb_h: int) -> QToolButton:
+        btn = QToolButton()
+        btn.setObjectName("FilmThumb")
+        btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
+        btn.setIconSize(QSize(thumb_w, thumb_h))
+        btn.setFixedSize(thumb_w + 18, thumb_h + 18)
+        btn.setProperty("selected", "false")
+        btn.setProperty("thumbPath", src_path)
+        btn.clicked.connect(lambda _checked=False, aid=asset_id: self._on_filmstrip_clicked(aid))
+        thumb = self._load_thumb_pixmap(Path(src_path), thumb_w, thumb_h)
+        if thumb.isNull():
+            fallback = QPixmap(thumb_w, thumb_h)
+            fallback.fill(QColor("#2B2B2B"))
+            btn.setIcon(QIcon(fallback))
+        else:
+            btn.setIcon(QIcon(thumb))
+        return btn
 
     def _on_filmstrip_clicked(self, asset_id: int) -> None:
         self._set_selected_asset(int(asset_id))
@@ -3405,33 +4087,95 @@ class CullingTab(QWidget):
             return
         self.filmstrip_area.ensureWidgetVisible(btn, 40, 2)
 
+    def _resolved_asset_path(self, file_path: Path | str) -> Path:
+        # resolve() stats every path component; on network mounts that is
+        # worth doing once per asset path rather than on every selection.
+        raw = str(file_path)
+        resolved = self._resolved_paths.get(raw)
+        if resolved is None:
+            resolved = self._resolved_paths[raw] = Path(raw).expanduser().resolve()
+        return resolved
+
+    def _preview_cache_key(self, file_path: Path) -> tuple[Path, str]:
+        resolved = self._resolved_asset_path(file_path)
+        try:
+            mtime_ns = resolved.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        # Keyed by mtime so an edited source is decoded again.
+        return resolved, f"{resolved}|{mtime_ns}"
+
     def _load_preview_pixmap(self, file_path: Path | None) -> QPixmap:
         if file_path is None:
             return QPixmap()
-        resolved = Path(file_path).expanduser().resolve()
-        key = str(resolved)
+        resolved, key = self._preview_cache_key(file_path)
         cached = self._preview_cache.get(key)
         if cached is not None:
             return cached
 
-        pixmap = QPixmap()
-        if self._prefetch_manager is not None:
-            warm_bytes = self._prefetch_manager.get_warmed_preview_bytes(resolved)
-            if warm_bytes:
-                pixmap.loadFromData(warm_bytes)
-            if pixmap.isNull():
-                cached_path = self._prefetch_manager.get_cached_preview_path(resolved)
-                if cached_path is not None and cached_path.exists():
-                    pixmap = QPixmap(str(cached_path))
-        if pixmap.isNull():
-            pixmap = QPixmap(str(resolved)) if resolved.exists() else QPixmap()
-        self._cache_put(self._preview_cache, self._preview_cache_order, key, pixmap, 24)
+        image, source_size = _decode_preview_image(resolved, self._prefetch_manager, self._preview_decode_bound())
+        pixmap = QPixmap.fromImage(image)
+        self._cache_preview(key, pixmap, source_size)
         return pixmap
 
+    def _cache_preview(self, key: str, pixmap: QPixmap, source_size: QSize | None) -> None:
+        self._cache_put(self._preview_cache, self._preview_cache_order, key, pixmap, 24)
+        if source_size is not None:
+            self._preview_source_sizes[key] = source_size
+        for stale in [k for k in self._preview_source_sizes if k not in self._preview_cache]:
+            del self._preview_source_sizes[stale]
+
+    def _preview_decode_bound(self) -> QSize | None:
+        # Previews never need more pixels than the screen can show, so large
+        # originals are decoded straight to that size.
+        screen = self.screen() or QApplication.primaryScreen()
+        if screen is None:
+            return None
+        return screen.size() * screen.devicePixelRatio()
+
+    def _request_preview(self, resolved: Path, key: str) -> None:
+        # Decode on the shared pool; only the latest requested key is shown,
+        # and queued decodes for other keys are cancelled before they start.
+        for pending_key, pending in self._preview_workers.items():
+            if pending_key != key:
+                pending.cancel()
+        pending = self._preview_workers.get(key)
+        if pending is not None and not pending.is_cancelled():
+            return
+        worker = JobWorker(_load_preview_image, key, resolved, self._prefetch_manager, self._preview_decode_bound())
+        self._preview_workers[key] = worker
+        worker.result.connect(self._on_preview_loaded, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(self._on_preview_worker_finished, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(worker.run)
+
+    def _start_pending_preview(self) -> None:
+        pending = self._pending_preview
+        self._pending_preview = None
+        if pending is not None and pending[1] == self._wanted_preview_key:
+            self._request_preview(*pending)
+
+    def _on_preview_loaded(self, payload) -> None:
+        key, image, missing, source_size = payload
+        if image is None:
+            return
+        pixmap = QPixmap.fromImage(image)
+        if not missing:
+            self._cache_preview(key, pixmap, source_size)
+        asset_id = self._selected_asset_id()
+        if key != self._wanted_preview_key or asset_id is None:
+            return
+        self._display_preview(int(asset_id), pixmap, key, missing=missing)
+
+    def _on_preview_worker_finished(self) -> None:
+        worker = self.sender()
+        for key, pending in list(self._preview_workers.items()):
+            if pending is worker:
+                del self._preview_workers[key]
+
     def _load_thumb_pixmap(self, file_path: Path | None, width: int, height: int) -> QPixmap:
         if file_path is None:
             return QPixmap()
-        resolved = Path(file_path).expanduser().resolve()
+        resolved = self._resolved_asset_path(file_path)
         key = f"{resolved}|{width}x{height}"
         cached = self._thumb_cache.get(key)
         if cached is not None:
@@ -3445,15 +4189,19 @@ class CullingTab(QWidget):
                     self._cache_put(self._thumb_cache, self._thumb_cache_order, key, thumb, 420)
                     return thumb
 
-        source = self._load_preview_pixmap(resolved)
-        if source.isNull():
-            thumb = QPixmap()
-        else:
+        _resolved, preview_key = self._preview_cache_key(resolved)
+        source = self._preview_cache.get(preview_key)
+        if source is not None and not source.isNull():
             thumb = source.scaled(
                 QSize(width, height),
                 Qt.AspectRatioMode.KeepAspectRatioByExpanding,
                 Qt.TransformationMode.SmoothTransformation,
             )
+        else:
+            image, _source_size = _read_scaled_image(
+                resolved, QSize(width, height), Qt.AspectRatioMode.KeepAspectRatioByExpanding
+            )
+            thumb = QPixmap.fromImage(image)
         self._cache_put(self._thumb_cache, self._thumb_cache_order, key, thumb, 420)
         return thumb
 
@@ -3506,11 +4254,13 @@ class CullingTab(QWidget):
             asset = self.assets_by_id.get(int(self.asset_order[pos]))
             if asset is None or not getattr(asset, "src_path", None):
                 continue
-            keep_paths.add(str(Path(str(asset.src_path)).expanduser().resolve()))
+            keep_paths.add(str(self._resolved_asset_path(asset.src_path)))
 
         for key in list(self._preview_cache.keys()):
-            if key not in keep_paths:
+            src_key = str(key).split("|", 1)[0]
+            if src_key not in keep_paths:
                 self._preview_cache.pop(key, None)
+                self._preview_source_sizes.pop(key, None)
                 try:
                     self._preview_cache_order.remove(key)
                 except ValueError:
@@ -3650,23 +4400,42 @@ class CullingTab(QWidget):
             return
 
         file_path = Path(str(asset.src_path)) if asset.src_path else None
+        if file_path is None:
+            self._wanted_preview_key = None
+            self._display_preview(int(asset_id), QPixmap())
+        else:
+            resolved, key = self._preview_cache_key(file_path)
+            self._wanted_preview_key = key
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                self._display_preview(int(asset_id), cached, key)
+            else:
+                # Keep the previous image on screen until the decode lands;
+                # the decode itself waits for navigation to pause.
+                self._set_info_overlay(asset, "...")
+                self._pending_preview = (resolved, key)
+                self._preview_debounce.start()
+        self._update_overlay_visibility()
+        self._prefetch_neighbors()
+        self._render_filmstrip(force=False)
 
-        preview_pixmap = self._load_preview_pixmap(file_path)
-        if preview_pixmap.isNull():
+    def _display_preview(self, asset_id: int, pixmap: QPixmap, source_key: str = "", missing: bool = False) -> None:
+        if pixmap.isNull():
             self.preview_label.setPixmap(QPixmap())
-            self.preview_label.setText("Apercu indisponible")
+            self.preview_label.setText("Fichier introuvable" if missing else "Apercu indisponible")
             resolution = "-"
         else:
-            self.preview_label.setText("")
-            scaled = preview_pixmap.scaled(
-                self.preview_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            self.preview_label.setPixmap(scaled)
-            resolution = f"{preview_pixmap.width()}x{preview_pixmap.height()}"
+            self._show_scaled_preview(source_key, pixmap)
+            # The pixmap may be a screen-bounded decode: report the photo's own size.
+            source_size = self._preview_source_sizes.get(source_key) or pixmap.size()
+            resolution = f"{source_size.width()}x{source_size.height()}"
+        self._set_info_overlay(self.assets_by_id.get(int(asset_id)), resolution)
 
-        name = file_path.name if file_path else "-"
+    def _set_info_overlay(self, asset, resolution: str) -> None:
+        if asset is None:
+            self.info_overlay_label.setText("Selection: -")
+            return
+        name = Path(str(asset.src_path)).name if asset.src_path else "-"
         rating = int(getattr(asset, "rating", 0))
         rejected = bool(getattr(asset, "is_rejected", False))
         index = self._selected_asset_index()
@@ -3675,14 +4444,42 @@ class CullingTab(QWidget):
         self.info_overlay_label.setText(
             f"{display_index}/{len(self.asset_order)} | {name} | note {rating} | {resolution}{reject_flag}"
         )
-        self._update_overlay_visibility()
-        self._prefetch_neighbors()
-        self._render_filmstrip(force=False)
+
+    def _show_scaled_preview(self, source_key: str, pixmap: QPixmap, smooth: bool = True) -> None:
+        # Scale to physical pixels so HiDPI previews stay sharp; the source
+        # key carries the mtime, so an edited file never hits a stale entry.
+        dpr = self.preview_label.devicePixelRatioF()
+        size = self.preview_label.size()
+        key = f"preview:{source_key}:{size.width()}x{size.height()}@{dpr:g}"
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            mode = Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
+            scaled = pixmap.scaled(size * dpr, Qt.AspectRatioMode.KeepAspectRatio, mode)
+            scaled.setDevicePixelRatio(dpr)
+            if smooth:
+                QPixmapCache.insert(key, scaled)
+        self.preview_label.setText("")
+        self.preview_label.setPixmap(scaled)
+
+    def _rescale_preview(self, smooth: bool) -> None:
+        asset_id = self._selected_asset_id()
+        asset = self.assets_by_id.get(int(asset_id)) if asset_id is not None else None
+        if asset is None or not asset.src_path:
+            return
+        _resolved, key = self._preview_cache_key(Path(str(asset.src_path)))
+        pixmap = self._preview_cache.get(key)
+        if pixmap is not None and not pixmap.isNull():
+            self._show_scaled_preview(key, pixmap, smooth=smooth)
+
+    def _apply_smooth_preview(self) -> None:
+        self._rescale_preview(smooth=True)
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        # Keep preview readable when panel size changes.
-        self._on_select_asset()
+        # Keep preview readable when panel size changes: fast rescale while
+        # dragging, smooth pass once the size settles.
+        self._rescale_preview(smooth=False)
+        self._smooth_preview_timer.start()
 
     def reset_layout_after_shell_resize(self) -> None:
         splitter = getattr(self, "body_splitter", None)
@@ -3783,9 +4580,7 @@ class CullingTab(QWidget):
         next_id = self._neighbor_asset_id(1) if self.auto_advance_check.isChecked() else None
         try:
             self.culling_service.update_asset(asset_id=asset_id, is_rejected=bool(rejected))
-            if next_id is not None:
-                self.selected_asset_id = int(next_id)
-            self._load_assets()
+            self._patch_asset(asset_id, next_id, is_rejected=bool(rejected))
             self._show_hud(hud_text, hud_state)
         except Exception as exc:
             QMessageBox.critical(self, "Erreur tri", str(exc))
@@ -3813,9 +4608,7 @@ class CullingTab(QWidget):
         next_id = self._neighbor_asset_id(1) if self.auto_advance_check.isChecked() else None
         try:
             self.culling_service.update_asset(asset_id=asset_id, rating=safe_rating)
-            if next_id is not None:
-                self.selected_asset_id = int(next_id)
-            self._load_assets()
+            self._patch_asset(asset_id, next_id, rating=safe_rating)
             self._show_hud(f"NOTE {safe_rating}", "ok")
         except Exception as exc:
             QMessageBox.critical(self, "Erreur tri", str(exc))
@@ -3828,11 +4621,46 @@ class CullingTab(QWidget):
         target_rejected = not bool(getattr(current, "is_rejected", False))
         try:
             self.culling_service.update_asset(asset_id=asset_id, is_rejected=target_rejected)
-            self._load_assets()
+            self._patch_asset(asset_id, None, is_rejected=target_rejected)
             self._show_hud("REJECT" if target_rejected else "KEEP", "warn" if target_rejected else "ok")
         except Exception as exc:
             QMessageBox.critical(self, "Erreur tri", str(exc))
 
+    def _patch_asset(
+        self,
+        asset_id: int,
+        next_id: int | None,
+        rating: int | None = None,
+        is_rejected: bool | None = None,
+    ) -> None:
+        # Single-asset edits patch the cached item; the list is only re-queried
+        # when the edit pushes the asset out of the active filters.
+        asset = self.assets_by_id.get(int(asset_id))
+        if asset is not None:
+            if rating is not None:
+                asset.rating = int(rating)
+            if is_rejected is not None:
+                asset.is_rejected = bool(is_rejected)
+        if asset is None or not self._asset_matches_filters(asset):
+            if next_id is not None:
+                self.selected_asset_id = int(next_id)
+            self._load_assets()
+            return
+        if next_id is not None:
+            self._set_selected_asset(int(next_id))
+        self._on_select_asset()
+
+    def _asset_matches_filters(self, asset) -> bool:
+        min_rating = int(self.min_rating_filter_combo.currentData() or 0)
+        if int(asset.rating) < min_rating:
+            return False
+        rejected_mode = self.rejected_mode_combo.currentData()
+        if rejected_mode == "kept":
+            return not bool(asset.is_rejected)
+        if rejected_mode == "rejected":
+            return bool(asset.is_rejected)
+        return True
+
     def _start_batch_rating(self) -> None:
         rating = int(self.batch_rating_combo.currentData() or 0)
         self._start_batch_job(rating=rating, is_rejected=None)
@@ -3844,7 +4672,7 @@ class CullingTab(QWidget):
         self._start_batch_job(rating=None, is_rejected=False)
 
     def _start_batch_job(self, rating: int | None, is_rejected: bool | None) -> None:
-        if self._job_thread is not None:
+        if self._job_worker is not None:
             QMessageBox.warning(self, "Operation en cours", "Un batch tri est deja en cours.")
             return
         project_id = self.project_combo.currentData()
@@ -3867,19 +4695,14 @@ class CullingTab(QWidget):
             rating=rating,
             is_rejected=is_rejected,
         )
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        worker.progress.connect(self._on_batch_progress)
-        worker.result.connect(self._on_batch_result)
-        worker.error.connect(self._on_batch_error)
-        worker.finished.connect(self._on_batch_finished)
-        worker.finished.connect(thread.quit)
-        thread.finished.connect(thread.deleteLater)
+        worker.progress.connect(self._on_batch_progress, Qt.ConnectionType.QueuedConnection)
+        worker.result.connect(self._on_batch_result, Qt.ConnectionType.QueuedConnection)
+        worker.error.connect(self._on_batch_error, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(self._on_batch_finished, Qt.ConnectionType.QueuedConnection)
 
         self._job_worker = worker
-        self._job_thread = thread
-        thread.start()
+        self._job_project_id = int(project_id)
+        _job_thread_pool().start(worker.run)
 
     def _cancel_batch(self) -> None:
         if self._job_worker is not None:
@@ -3894,7 +4717,7 @@ class CullingTab(QWidget):
 
     def _on_batch_result(self, result) -> None:
         self._load_assets()
-        self.on_data_changed()
+        self.on_data_changed(scope={"assets"}, project_id=self._job_project_id)
         self.on_job_event(f"[Tri] {result.status} | maj={result.updated}/{result.total}")
         QMessageBox.information(
             self,
@@ -3910,10 +4733,13 @@ class CullingTab(QWidget):
         self.batch_cancel_btn.setEnabled(False)
         self.on_operation_ended()
         self._job_worker = None
-        self._job_thread = None
         self.on_job_event("[Tri] Job batch termine.")
 
     def closeEvent(self, event) -> None:
+        self._preview_debounce.stop()
+        self._pending_preview = None
+        for worker in self._preview_workers.values():
+            worker.cancel()
         if self._prefetch_manager is not None:
             try:
                 self._prefetch_manager.shutdown()
@@ -3968,6 +4794,7 @@ class EditTab(QWidget):
         controls_layout.setContentsMargins(12, 8, 12, 8)
         controls_layout.setSpacing(8)
         self.project_combo = QComboBox()
+        self._project_index: dict[int, int] = {}
         self.project_combo.currentIndexChanged.connect(self._load_assets)
 
         self.rejected_mode_combo = QComboBox()
@@ -4359,23 +5186,17 @@ class EditTab(QWidget):
         )
         self._shortcut_refs.append(before_after_shortcut)
 
-    def refresh_data(self) -> None:
-        current = self.project_combo.currentData()
-        self.project_combo.blockSignals(True)
-        self.project_combo.clear()
-        for project in self.project_service.list_projects():
-            self.project_combo.addItem(f"{project.id} - {project.name}", userData=project.id)
-        if current is not None:
-            idx = self.project_combo.findData(current)
-            if idx >= 0:
-                self.project_combo.setCurrentIndex(idx)
-        self.project_combo.blockSignals(False)
+    def refresh_data(self, projects: list | None = None) -> None:
+        self._project_index = _fill_project_combo(
+            self.project_combo,
+            self.project_service,
+            limit=None,
+            projects=projects,
+        )
         self._load_assets()
 
     def set_selected_project(self, project_id: int) -> None:
-        idx = self.project_combo.findData(project_id)
-        if idx >= 0:
-            self.project_combo.setCurrentIndex(idx)
+        _select_project_in_combo(self.project_combo, self._project_index, self.project_service, project_id)
 
     def _toggle_advanced_panel(self, opened: bool) -> None:
         self.advanced_panel.setVisible(opened)
@@ -4872,6 +5693,16 @@ class EditTab(QWidget):
         self.on_job_event("[Edit] Sync termine.")
 
 
+def _resolve_delivery_config(preset_service: PresetService, project_id: int, **_job_kwargs) -> tuple[int, dict]:
+    try:
+        config = preset_service.resolve_effective_config_for_project(project_id)
+    except Exception:
+        config = DEFAULT_PRESET_CONFIG
+    delivery = config.get("delivery")
+    # Presets may carry a non-dict "delivery" (e.g. null): use the defaults then.
+    return project_id, dict(delivery) if isinstance(delivery, dict) else {}
+
+
 class ExportTab(QWidget):
     def __init__(
         self,
@@ -4893,8 +5724,12 @@ class ExportTab(QWidget):
         self.on_job_event = on_job_event or (lambda _message: None)
         self._worker_id = f"export-ui-{id(self)}"
         self._last_auto_destination = ""
-        self._job_thread: QThread | None = None
         self._job_worker: JobWorker | None = None
+        self._destination_dialog: QFileDialog | None = None
+        self._validation_box: QMessageBox | None = None
+        self._delivery_project_id: int | None = None
+        # Pending delivery lookups, mapped to the project each one resolves.
+        self._delivery_workers: dict[JobWorker, int] = {}
         self._queue_seq = 0
         self._queue_paused = False
         self._active_started_at: datetime | None = None
@@ -4907,6 +5742,7 @@ class ExportTab(QWidget):
         controls_layout = QFormLayout(controls)
 
         self.project_combo = QComboBox()
+        self._project_index: dict[int, int] = {}
         self.project_combo.currentIndexChanged.connect(self._sync_export_context)
 
         destination_row = QHBoxLayout()
@@ -4924,9 +5760,13 @@ class ExportTab(QWidget):
         self.print_check.setChecked(True)
         self.social_check = QCheckBox("social")
         self.social_check.setChecked(True)
-        profiles_row.addWidget(self.web_check)
-        profiles_row.addWidget(self.print_check)
-        profiles_row.addWidget(self.social_check)
+        self._profile_checks = (
+            ("web", self.web_check),
+            ("print", self.print_check),
+            ("social", self.social_check),
+        )
+        for _profile, check in self._profile_checks:
+            profiles_row.addWidget(check)
 
         self.min_rating_combo = QComboBox()
         for rating in range(0, 6):
@@ -4965,9 +5805,14 @@ class ExportTab(QWidget):
         self.report_check.setChecked(True)
         self.contact_sheet_check = QCheckBox("Planche contact PDF")
         self.contact_sheet_check.setChecked(True)
-        delivery_row.addWidget(self.zip_check)
-        delivery_row.addWidget(self.report_check)
-        delivery_row.addWidget(self.contact_sheet_check)
+        # (export payload key, preset "delivery" key, checkbox)
+        self._delivery_checks = (
+            ("create_zip", "create_zip", self.zip_check),
+            ("create_report", "create_report", self.report_check),
+            ("create_contact_sheet", "create_contact_sheet_pdf", self.contact_sheet_check),
+        )
+        for _key, _preset_key, check in self._delivery_checks:
+            delivery_row.addWidget(check)
 
         self.run_btn = _new_button("Ajouter + Lancer", primary=True)
         self.run_btn.clicked.connect(self._run_export)
@@ -5053,33 +5898,29 @@ class ExportTab(QWidget):
             if recovered > 0:
                 self.on_job_event(f"[Export] {recovered} job(s) stale recupere(s).")
 
-    def refresh_data(self) -> None:
-        current = self.project_combo.currentData()
-        self.project_combo.blockSignals(True)
-        self.project_combo.clear()
-        for project in self.project_service.list_projects():
-            self.project_combo.addItem(f"{project.id} - {project.name}", userData=project.id)
-        if current is not None:
-            idx = self.project_combo.findData(current)
-            if idx >= 0:
-                self.project_combo.setCurrentIndex(idx)
-        self.project_combo.blockSignals(False)
+    def refresh_data(self, projects: list | None = None) -> None:
+        self._project_index = _fill_project_combo(
+            self.project_combo,
+            self.project_service,
+            limit=None,
+            projects=projects,
+        )
         self._sync_export_context()
         self._load_queue_from_backend()
         self._refresh_queue_view()
 
     def set_selected_project(self, project_id: int) -> None:
-        idx = self.project_combo.findData(project_id)
-        if idx >= 0:
-            self.project_combo.setCurrentIndex(idx)
+        _select_project_in_combo(self.project_combo, self._project_index, self.project_service, project_id)
 
     def _sync_export_context(self) -> None:
         project_id = self.project_combo.currentData()
         if project_id is None:
+            self._set_delivery_pending(None)
             self._set_quality_banner(None)
             return
         project = self.project_service.get_project(project_id)
         if project is None:
+            self._set_delivery_pending(None)
             self._set_quality_banner(None)
             return
         self._sync_default_destination(project)
@@ -5094,21 +5935,47 @@ class ExportTab(QWidget):
         self._last_auto_destination = auto_destination
 
     def _sync_delivery_options_from_preset(self, project) -> None:
-        config = default_preset_config()
-        try:
-            config = self.preset_service.resolve_effective_config_for_project(project.id)
-        except Exception:
-            pass
-
-        delivery = config.get("delivery", {})
-        self.zip_check.setChecked(bool(delivery.get("create_zip", True)))
-        self.report_check.setChecked(bool(delivery.get("create_report", True)))
-        self.contact_sheet_check.setChecked(bool(delivery.get("create_contact_sheet_pdf", True)))
+        # Resolving the preset hits the DB: do it on the pool and keep only
+        # the answer for the project that is still selected.
+        project_id = int(project.id)
+        self._set_delivery_pending(project_id)
+        worker = JobWorker(_resolve_delivery_config, self.preset_service, project_id)
+        self._delivery_workers[worker] = project_id
+        worker.result.connect(self._on_delivery_config_loaded, Qt.ConnectionType.QueuedConnection)
+        worker.error.connect(self._on_delivery_config_error, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(self._on_delivery_worker_finished, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(worker.run)
+
+    def _on_delivery_config_loaded(self, payload) -> None:
+        project_id, delivery = payload
+        if project_id != self._delivery_project_id:
+            return
+        for _key, preset_key, check in self._delivery_checks:
+            check.setChecked(bool(delivery.get(preset_key, True)))
+        self._set_delivery_pending(None)
+
+    def _on_delivery_config_error(self, _message: str) -> None:
+        # Fall back to the default flags so the enqueue buttons come back.
+        project_id = self._delivery_workers.get(self.sender())
+        if project_id is not None:
+            self._on_delivery_config_loaded((project_id, {}))
+
+    def _set_delivery_pending(self, project_id: int | None) -> None:
+        # While a project's delivery flags load, the checkboxes still show the
+        # previous project's: keep the enqueue buttons off until they land.
+        self._delivery_project_id = project_id
+        pending = project_id is not None
+        self.run_btn.setEnabled(not pending)
+        self.queue_add_btn.setEnabled(not pending)
+
+    def _on_delivery_worker_finished(self) -> None:
+        self._delivery_workers.pop(self.sender(), None)
 
     def _pick_destination(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Choisir dossier destination")
-        if directory:
-            self.destination_edit.setText(directory)
+        if self._destination_dialog is None:
+            self._destination_dialog = _new_directory_dialog(self, "Choisir dossier destination")
+        if self._destination_dialog.exec() and self._destination_dialog.selectedFiles():
+            self.destination_edit.setText(self._destination_dialog.selectedFiles()[0])
 
     @staticmethod
     def _quality_state_text(state: str) -> str:
@@ -5158,7 +6025,7 @@ class ExportTab(QWidget):
     def _verify_quality_gate(self) -> None:
         project_id = self.project_combo.currentData()
         if project_id is None:
-            QMessageBox.warning(self, "Checklist", "Selectionne un projet.")
+            _show_warning(self, "Checklist", "Selectionne un projet.")
             return
         min_rating = int(self.min_rating_combo.currentData() or 0)
         try:
@@ -5174,7 +6041,7 @@ class ExportTab(QWidget):
     def _validate_quality_gate(self) -> None:
         project_id = self.project_combo.currentData()
         if project_id is None:
-            QMessageBox.warning(self, "Checklist", "Selectionne un projet.")
+            _show_warning(self, "Checklist", "Selectionne un projet.")
             return
         try:
             self.project_service.validate_quality_check(int(project_id))
@@ -5192,21 +6059,15 @@ class ExportTab(QWidget):
         project_id = self.project_combo.currentData()
         destination = self.destination_edit.text().strip()
         if project_id is None:
-            QMessageBox.warning(self, "Validation", "Selectionne un projet.")
+            _show_warning(self, "Validation", "Selectionne un projet.")
             return None
         if not destination:
-            QMessageBox.warning(self, "Validation", "Selectionne un dossier destination.")
+            _show_warning(self, "Validation", "Selectionne un dossier destination.")
             return None
 
-        profiles: list[str] = []
-        if self.web_check.isChecked():
-            profiles.append("web")
-        if self.print_check.isChecked():
-            profiles.append("print")
-        if self.social_check.isChecked():
-            profiles.append("social")
+        profiles = [profile for profile, check in self._profile_checks if check.isChecked()]
         if not profiles:
-            QMessageBox.warning(self, "Validation", "Selectionne au moins un profil.")
+            _show_warning(self, "Validation", "Selectionne au moins un profil.")
             return None
 
         safe_min_rating = int(self.min_rating_combo.currentData() or 0)
@@ -5227,9 +6088,7 @@ class ExportTab(QWidget):
             "destination_dir": destination,
             "profiles": profiles,
             "min_rating": safe_min_rating,
-            "create_zip": self.zip_check.isChecked(),
-            "create_report": self.report_check.isChecked(),
-            "create_contact_sheet": self.contact_sheet_check.isChecked(),
+            **{key: check.isChecked() for key, _preset_key, check in self._delivery_checks},
         }
 
     @staticmethod
@@ -5359,7 +6218,7 @@ class ExportTab(QWidget):
         return None
 
     def _start_next_queue_item(self) -> None:
-        if self._job_thread is not None:
+        if self._job_worker is not None:
             return
         if self._queue_paused:
             self._refresh_queue_view()
@@ -5428,19 +6287,13 @@ class ExportTab(QWidget):
             create_report=bool(item.create_report),
             create_contact_sheet=bool(item.create_contact_sheet),
         )
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
-        worker.progress.connect(self._on_export_progress)
-        worker.result.connect(self._on_export_result)
-        worker.error.connect(self._on_export_error)
-        worker.finished.connect(self._on_export_finished)
-        worker.finished.connect(thread.quit)
-        thread.finished.connect(thread.deleteLater)
+        worker.progress.connect(self._on_export_progress, Qt.ConnectionType.QueuedConnection)
+        worker.result.connect(self._on_export_result, Qt.ConnectionType.QueuedConnection)
+        worker.error.connect(self._on_export_error, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(self._on_export_finished, Qt.ConnectionType.QueuedConnection)
 
         self._job_worker = worker
-        self._job_thread = thread
-        thread.start()
+        _job_thread_pool().start(worker.run)
 
     def _cancel_export(self) -> None:
         if self._job_worker is not None:
@@ -5485,24 +6338,26 @@ class ExportTab(QWidget):
         self._refresh_queue_view()
 
     def _on_export_progress(self, done: int, total: int, detail: str) -> None:
-        safe_total = max(1, int(total))
-        self.progress_bar.setMaximum(safe_total)
-        self.progress_bar.setValue(max(0, min(int(done), safe_total)))
+        # JobWorker.progress is Signal(int, int, str): no coercion needed.
+        safe_total = total if total > 0 else 1
+        if safe_total != self.progress_bar.maximum():
+            self.progress_bar.setMaximum(safe_total)
+        self.progress_bar.setValue(max(0, min(done, safe_total)))
         active_item = self._queue_item_by_id(self._active_queue_id)
         if self.job_queue_service is not None and active_item is not None and active_item.db_job_id is not None:
             try:
                 self.job_queue_service.heartbeat(
                     job_id=int(active_item.db_job_id),
                     worker_id=self._worker_id,
-                    progress_done=int(done),
-                    progress_total=int(total),
-                    message=str(detail),
+                    progress_done=done,
+                    progress_total=total,
+                    message=detail,
                 )
             except Exception:
                 pass
         if self._active_started_at is not None and done > 0:
             elapsed = max(0.001, (datetime.utcnow() - self._active_started_at).total_seconds())
-            remaining = int(round((elapsed / float(done)) * max(0, safe_total - int(done))))
+            remaining = round((elapsed / done) * max(0, safe_total - done))
             self.eta_label.setText(f"ETA: ~{remaining}s ({detail})")
         else:
             self.eta_label.setText(f"ETA: calcul... ({detail})")
@@ -5511,8 +6366,10 @@ class ExportTab(QWidget):
         total_exported = 0
         total_failed = 0
         cancelled = False
+        # Collect the whole summary and append it once: one layout pass.
+        lines: list[str] = []
         for item in batch.profiles:
-            self.log_text.appendPlainText(
+            lines.append(
                 f"Export {item.profile}: {item.status} | exported={item.exported}, "
                 f"failed={item.failed} | out={item.output_dir}"
             )
@@ -5521,13 +6378,15 @@ class ExportTab(QWidget):
             if str(item.status).lower().startswith("cancel"):
                 cancelled = True
             if item.message:
-                self.log_text.appendPlainText(item.message)
+                lines.append(item.message)
         if batch.report_path is not None:
-            self.log_text.appendPlainText(f"Rapport export: {batch.report_path}")
+            lines.append(f"Rapport export: {batch.report_path}")
         if batch.zip_path is not None:
-            self.log_text.appendPlainText(f"ZIP livraison: {batch.zip_path}")
+            lines.append(f"ZIP livraison: {batch.zip_path}")
         if batch.contact_sheet_path is not None:
-            self.log_text.appendPlainText(f"Planche contact PDF: {batch.contact_sheet_path}")
+            lines.append(f"Planche contact PDF: {batch.contact_sheet_path}")
+        if lines:
+            self.log_text.appendPlainText("\n".join(lines))
 
         active_item = self._queue_item_by_id(self._active_queue_id)
         if active_item is not None:
@@ -5600,7 +6459,6 @@ class ExportTab(QWidget):
         self.eta_label.setText("ETA: -")
         self.on_operation_ended()
         self._job_worker = None
-        self._job_thread = None
         self._active_queue_id = None
         self._active_started_at = None
         self._load_queue_from_backend()
@@ -5688,6 +6546,30 @@ class ExportTab(QWidget):
         self._render_queue_cards()
 
 
+def _list_preset_version_items(
+    preset_service: PresetService, preset_id: int, generation: int, **_job_kwargs
+) -> tuple[int, list[tuple[str, int]]]:
+    items = [
+        (f"v{version.version} - {version.created_at.strftime('%Y-%m-%d %H:%M:%S')}", version.id)
+        for version in preset_service.list_versions(preset_id)
+    ]
+    return generation, items
+
+
+_EXPORT_FORMATS = ("JPEG", "PNG", "TIFF")
+_FORMAT_INDEX = {fmt: index for index, fmt in enumerate(_EXPORT_FORMATS)}
+
+
+@dataclass(frozen=True)
+class _ProfileWidgets:
+    """Form controls of one export profile card in PresetTab."""
+
+    format: QComboBox
+    max_width: QSpinBox
+    quality: QSlider
+    subdir: QLineEdit
+
+
 class PresetTab(QWidget):
     def __init__(self, preset_service: PresetService, on_data_changed) -> None:
         super().__init__()
@@ -5695,8 +6577,22 @@ class PresetTab(QWidget):
         self.on_data_changed = on_data_changed
         self.current_preset_id: int | None = None
         self.expanded_preset_ids: set[int] = set()
-        self.profile_widgets: dict[str, dict[str, object]] = {}
-        self.watermark_cfg = normalize_watermark_config(default_preset_config().get("watermark", {}))
+        self._linked_cache: dict[tuple[int, int], tuple[str, str]] = {}
+        self.profile_widgets: dict[str, _ProfileWidgets] = {}
+        self.watermark_cfg = normalize_watermark_config(DEFAULT_PRESET_CONFIG["watermark"])
+        # The form is clean while it still matches the last applied config;
+        # these let reselection and form -> JSON skip redundant work.
+        self._form_dirty = False
+        self._applied_config_text: str | None = None
+        self._form_json_text: str | None = None
+        self._json_sync_pending = False
+        self._backup_dialog: QFileDialog | None = None
+        self._validation_box: QMessageBox | None = None
+        # (preset id, name, form config, stored JSON) of the preset last
+        # loaded or saved, so an unchanged save can be skipped.
+        self._loaded_preset: tuple[int, str, dict, str] | None = None
+        self._versions_generation = 0
+        self._versions_workers: set[JobWorker] = set()
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -5772,6 +6668,7 @@ class PresetTab(QWidget):
         json_layout.addWidget(self.config_edit)
         self.config_tabs.addTab(self.form_config_tab, "Formulaire")
         self.config_tabs.addTab(self.json_config_tab, "JSON")
+        self.config_tabs.currentChanged.connect(self._on_config_tab_changed)
         form_layout.addWidget(self.config_tabs, 1)
 
         sync_row = QHBoxLayout()
@@ -5813,8 +6710,30 @@ class PresetTab(QWidget):
         split.setStretchFactor(0, 3)
         split.setStretchFactor(1, 1)
         split.setSizes([1000, 320])
+        self._watch_form_changes()
         self._reset_form()
 
+    def _watch_form_changes(self) -> None:
+        for edit in (self.naming_pattern_edit, self.import_backup_path_edit):
+            edit.textChanged.connect(self._mark_form_dirty)
+        for check in (
+            self.import_verify_checksum_check,
+            self.import_dual_backup_check,
+            self.watermark_enabled_check,
+            self.delivery_zip_check,
+            self.delivery_report_check,
+            self.delivery_contact_sheet_check,
+        ):
+            check.toggled.connect(self._mark_form_dirty)
+        for widgets in self.profile_widgets.values():
+            widgets.format.currentIndexChanged.connect(self._mark_form_dirty)
+            widgets.max_width.valueChanged.connect(self._mark_form_dirty)
+            widgets.quality.valueChanged.connect(self._mark_form_dirty)
+            widgets.subdir.textChanged.connect(self._mark_form_dirty)
+
+    def _mark_form_dirty(self, *_args) -> None:
+        self._form_dirty = True
+
     def reset_layout_after_shell_resize(self) -> None:
         splitter = getattr(self, "main_splitter", None)
         if splitter is None:
@@ -5824,8 +6743,13 @@ class PresetTab(QWidget):
         left = max(520, total - right)
         splitter.setSizes([left, right])
 
-    def refresh_data(self) -> None:
-        presets = self.preset_service.list_presets()
+    def refresh_data(self, presets: list | None = None) -> None:
+        if presets is None:
+            presets = self.preset_service.list_presets()
+        else:
+            # A snapshot means data changed somewhere (links, renames):
+            # recompute the linked project labels.
+            self._linked_cache.clear()
         ids = {preset.id for preset in presets}
         if self.current_preset_id not in ids:
             self.current_preset_id = None
@@ -5835,8 +6759,8 @@ class PresetTab(QWidget):
             filtered = []
             for preset in presets:
                 name_match = search in str(preset.name).lower()
-                date_match = search in preset.updated_at.strftime("%Y-%m-%d").lower()
-                project_match = search in self._linked_projects_summary(preset).lower()
+                date_match = search in _iso(preset.updated_at.date())
+                project_match = search in self._linked_projects(preset)[0].lower()
                 if name_match or date_match or project_match:
                     filtered.append(preset)
         else:
@@ -5865,6 +6789,14 @@ class PresetTab(QWidget):
                 widget.deleteLater()
 
     def _render_preset_cards(self, presets: list) -> None:
+        # Rebuild the whole list with repaints off so it lays out once.
+        self.preset_cards_content.setUpdatesEnabled(False)
+        try:
+            self._fill_preset_cards(presets)
+        finally:
+            self.preset_cards_content.setUpdatesEnabled(True)
+
+    def _fill_preset_cards(self, presets: list) -> None:
         self._clear_preset_cards()
         if not presets:
             empty = QLabel("Aucun preset.")
@@ -5898,17 +6830,18 @@ class PresetTab(QWidget):
         select_btn.clicked.connect(
             lambda _checked=False, preset_id=preset.id: self._on_preset_card_selected(preset_id)
         )
-        date_label = QLabel(preset.updated_at.strftime("%Y-%m-%d"))
+        date_label = QLabel(_iso(preset.updated_at.date()))
         date_label.setObjectName("CardBadge")
         date_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         header.addWidget(select_btn, 1)
         header.addWidget(date_label)
         card_layout.addLayout(header)
 
-        project_label = QLabel(self._linked_projects_summary(preset))
+        summary, tooltip = self._linked_projects(preset)
+        project_label = QLabel(summary)
         project_label.setObjectName("CardMuted")
         project_label.setWordWrap(True)
-        project_label.setToolTip(self._linked_projects_tooltip(preset))
+        project_label.setToolTip(tooltip)
         card_layout.addWidget(project_label)
         return card
 
@@ -5923,10 +6856,30 @@ class PresetTab(QWidget):
             return
         self.current_preset_id = preset.id
         self.name_edit.setText(preset.name)
-        self.associated_projects_label.setText(self._linked_projects_tooltip(preset))
+        self.associated_projects_label.setText(self._linked_projects(preset)[1])
         self._set_config_from_json_text(preset.config_json)
+        self._remember_loaded_preset(preset)
         self._refresh_versions()
 
+    def _remember_loaded_preset(self, preset) -> None:
+        self._loaded_preset = (
+            int(preset.id),
+            str(preset.name),
+            self._build_config_from_form(),
+            str(preset.config_json),
+        )
+
+    def _is_unchanged_save(self, name: str, config: dict) -> bool:
+        loaded = self._loaded_preset
+        if loaded is None or loaded[0] != self.current_preset_id or loaded[1] != name:
+            return False
+        if self.config_tabs.currentIndex() == 0:
+            return config == loaded[2]
+        try:
+            return config == self.preset_service.parse_config(loaded[3])
+        except Exception:
+            return False
+
     @staticmethod
     def _card_value(value: str) -> QLabel:
         text = str(value)
@@ -5939,12 +6892,13 @@ class PresetTab(QWidget):
 
     def _reset_form(self) -> None:
         self.current_preset_id = None
+        self._loaded_preset = None
         self.name_edit.clear()
         self.associated_projects_label.setText("Projets associes: -")
-        self._apply_config_to_form(default_preset_config())
+        self._apply_config_to_form({})
         self._sync_json_from_form()
         self.config_tabs.setCurrentIndex(0)
-        self.version_combo.clear()
+        self._refresh_versions()
 
     def _save(self) -> None:
         name = self.name_edit.text().strip()
@@ -5954,7 +6908,7 @@ class PresetTab(QWidget):
         else:
             config_text = self.config_edit.toPlainText().strip()
             if not config_text:
-                QMessageBox.warning(self, "Validation", "La config JSON est obligatoire.")
+                _show_warning(self, "Validation", "La config JSON est obligatoire.")
                 return
             try:
                 config = self.preset_service.parse_config(config_text)
@@ -5964,7 +6918,10 @@ class PresetTab(QWidget):
             self._apply_config_to_form(config)
 
         if not name:
-            QMessageBox.warning(self, "Validation", "Le nom du preset est obligatoire.")
+            _show_warning(self, "Validation", "Le nom du preset est obligatoire.")
+            return
+        if self._is_unchanged_save(name, config):
+            # Nothing to write: no DB update, no new version, no refresh.
             return
         try:
             if self.current_preset_id is None:
@@ -5974,11 +6931,12 @@ class PresetTab(QWidget):
                 )
                 self.current_preset_id = preset.id
             else:
-                self.preset_service.update_preset(
+                preset = self.preset_service.update_preset(
                     preset_id=self.current_preset_id,
                     name=name,
                     config=config,
                 )
+            self._remember_loaded_preset(preset)
             self.on_data_changed()
             self._refresh_versions()
         except Exception as exc:
@@ -5986,7 +6944,7 @@ class PresetTab(QWidget):
 
     def _delete(self) -> None:
         if self.current_preset_id is None:
-            QMessageBox.warning(self, "Selection", "Selectionne un preset a supprimer.")
+            _show_warning(self, "Selection", "Selectionne un preset a supprimer.")
             return
         choice = QMessageBox.question(
             self,
@@ -6003,21 +6961,42 @@ class PresetTab(QWidget):
             QMessageBox.critical(self, "Erreur suppression", str(exc))
 
     def _refresh_versions(self) -> None:
+        # A newer request (or a reset) bumps the generation so late results
+        # for another preset are dropped.
+        self._versions_generation += 1
+        # Never leave another preset's versions selectable while loading.
         self.version_combo.clear()
         if self.current_preset_id is None:
             return
-        versions = self.preset_service.list_versions(self.current_preset_id)
-        for version in versions:
-            label = f"v{version.version} - {version.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
-            self.version_combo.addItem(label, userData=version.id)
+        worker = JobWorker(
+            _list_preset_version_items,
+            self.preset_service,
+            int(self.current_preset_id),
+            self._versions_generation,
+        )
+        self._versions_workers.add(worker)
+        worker.result.connect(self._on_versions_loaded, Qt.ConnectionType.QueuedConnection)
+        worker.finished.connect(self._on_versions_worker_finished, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(worker.run)
+
+    def _on_versions_loaded(self, payload) -> None:
+        generation, items = payload
+        if generation != self._versions_generation:
+            return
+        self.version_combo.clear()
+        for label, version_id in items:
+            self.version_combo.addItem(label, userData=version_id)
+
+    def _on_versions_worker_finished(self) -> None:
+        self._versions_workers.discard(self.sender())
 
     def _rollback(self) -> None:
         if self.current_preset_id is None:
-            QMessageBox.warning(self, "Selection", "Selectionne un preset avant rollback.")
+            _show_warning(self, "Selection", "Selectionne un preset avant rollback.")
             return
         version_id = self.version_combo.currentData()
         if version_id is None:
-            QMessageBox.warning(self, "Selection", "Aucune version selectionnee.")
+            _show_warning(self, "Selection", "Aucune version selectionnee.")
             return
         choice = QMessageBox.question(
             self,
@@ -6029,6 +7008,7 @@ class PresetTab(QWidget):
         try:
             preset = self.preset_service.rollback_to_version(self.current_preset_id, int(version_id))
             self._set_config_from_json_text(preset.config_json)
+            self._remember_loaded_preset(preset)
             self.on_data_changed()
             self._refresh_versions()
         except Exception as exc:
@@ -6212,7 +7192,7 @@ class PresetTab(QWidget):
         format_label = QLabel("Format")
         format_label.setObjectName("PresetProfileFieldLabel")
         format_combo = QComboBox()
-        format_combo.addItems(["JPEG", "PNG", "TIFF"])
+        format_combo.addItems(list(_EXPORT_FORMATS))
         format_combo.setToolTip("Format de sortie du profil.")
 
         width_label = QLabel("Max px")
@@ -6255,12 +7235,12 @@ class PresetTab(QWidget):
         body_layout.addStretch(1)
 
         card_layout.addWidget(body, 1)
-        self.profile_widgets[profile] = {
-            "format": format_combo,
-            "max_width": width_spin,
-            "quality": quality_slider,
-            "subdir": subdir_edit,
-        }
+        self.profile_widgets[profile] = _ProfileWidgets(
+            format=format_combo,
+            max_width=width_spin,
+            quality=quality_slider,
+            subdir=subdir_edit,
+        )
         quality_slider.setValue(85)
         return box
 
@@ -6273,6 +7253,11 @@ class PresetTab(QWidget):
         self._refresh_watermark_summary()
 
     def _open_watermark_editor(self) -> None:
+        # The editor (and its dialog classes) load on first use, not at startup.
+        from PySide6.QtWidgets import QDialog
+
+        from .watermark_editor import WatermarkEditorDialog
+
         current = normalize_watermark_config(self.watermark_cfg)
         current["enabled"] = bool(self.watermark_enabled_check.isChecked())
         dialog = WatermarkEditorDialog(
@@ -6285,6 +7270,7 @@ class PresetTab(QWidget):
         self.watermark_cfg = normalize_watermark_config(dialog.get_config())
         self.watermark_enabled_check.setChecked(bool(self.watermark_cfg.get("enabled", False)))
         self._refresh_watermark_summary()
+        self._form_dirty = True
 
     def _refresh_watermark_summary(self) -> None:
         self.watermark_cfg = normalize_watermark_config(self.watermark_cfg)
@@ -6292,23 +7278,55 @@ class PresetTab(QWidget):
         self.watermark_summary_label.setText(summarize_watermark_config(self.watermark_cfg))
 
     def _pick_backup_path(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Choisir dossier backup")
-        if directory:
-            self.import_backup_path_edit.setText(directory)
+        if self._backup_dialog is None:
+            self._backup_dialog = _new_directory_dialog(self, "Choisir dossier backup")
+        if self._backup_dialog.exec() and self._backup_dialog.selectedFiles():
+            self.import_backup_path_edit.setText(self._backup_dialog.selectedFiles()[0])
 
     def _set_config_from_json_text(self, config_text: str) -> None:
+        if (
+            config_text == self._applied_config_text
+            and not self._form_dirty
+            and self.config_edit.toPlainText() == config_text
+        ):
+            # Reselecting the preset already shown: form and JSON are current.
+            return
+        self._json_sync_pending = False
         self.config_edit.setPlainText(config_text)
         try:
             payload = self.preset_service.parse_config(config_text)
         except Exception:
-            payload = default_preset_config()
+            payload = {}
         self._apply_config_to_form(payload)
+        self._applied_config_text = config_text
 
     def _sync_json_from_form(self) -> None:
+        if self.config_tabs.currentIndex() != 1:
+            # Nobody can see the JSON yet: serialize when its tab is shown.
+            self._json_sync_pending = True
+            return
+        self._render_form_json()
+
+    def _on_config_tab_changed(self, index: int) -> None:
+        if index == 1 and self._json_sync_pending:
+            self._render_form_json()
+
+    def _render_form_json(self) -> None:
+        self._json_sync_pending = False
+        if not self._form_dirty and self._form_json_text is not None:
+            if self.config_edit.toPlainText() == self._form_json_text:
+                return
+        if self._form_dirty:
+            # The form no longer matches the config it was loaded from.
+            self._applied_config_text = None
+            self._form_dirty = False
         config = self._build_config_from_form()
-        self.config_edit.setPlainText(json.dumps(config, ensure_ascii=True, indent=2))
+        self._form_json_text = json.dumps(config, ensure_ascii=True, indent=2)
+        self.config_edit.setPlainText(self._form_json_text)
 
     def _sync_form_from_json(self) -> None:
+        if self._json_sync_pending:
+            self._render_form_json()
         try:
             config = self.preset_service.parse_config(self.config_edit.toPlainText().strip())
         except Exception as exc:
@@ -6317,7 +7335,38 @@ class PresetTab(QWidget):
         self._apply_config_to_form(config)
 
     def _apply_config_to_form(self, config: dict) -> None:
-        merged = self._deep_merge(default_preset_config(), config)
+        # Loading a config is not an edit: silence the inputs while filling
+        # them and run the dependent updates explicitly instead.
+        blockers = [QSignalBlocker(widget) for widget in self._blockable_form_inputs()]
+        try:
+            self._fill_form_from_config(config)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        self._form_dirty = False
+        self._applied_config_text = None
+        self._form_json_text = None
+
+    def _blockable_form_inputs(self) -> list[QWidget]:
+        # Quality sliders stay live: their valueChanged drives the value label.
+        widgets: list[QWidget] = [
+            self.naming_pattern_edit,
+            self.import_verify_checksum_check,
+            self.import_dual_backup_check,
+            self.import_backup_path_edit,
+            self.watermark_enabled_check,
+            self.delivery_zip_check,
+            self.delivery_report_check,
+            self.delivery_contact_sheet_check,
+        ]
+        for profile in self.profile_widgets.values():
+            widgets.extend((profile.format, profile.max_width, profile.subdir))
+        return widgets
+
+    def _fill_form_from_config(self, config: dict) -> None:
+        # _deep_merge copies what it changes and the form only reads the
+        # result, so the shared defaults can be merged in without a deepcopy.
+        merged = self._deep_merge(DEFAULT_PRESET_CONFIG, config)
 
         naming = merged.get("naming", {})
         self.naming_pattern_edit.setText(str(naming.get("pattern", "")))
@@ -6334,14 +7383,13 @@ class PresetTab(QWidget):
         export_profiles = merged.get("export_profiles", {})
         for profile, widgets in self.profile_widgets.items():
             cfg = export_profiles.get(profile, {})
-            format_combo = widgets["format"]
-            width_spin = widgets["max_width"]
-            quality_spin = widgets["quality"]
-            subdir_edit = widgets["subdir"]
+            format_combo = widgets.format
+            width_spin = widgets.max_width
+            quality_spin = widgets.quality
+            subdir_edit = widgets.subdir
 
             fmt = str(cfg.get("format", "JPEG")).upper()
-            idx = format_combo.findText(fmt)
-            format_combo.setCurrentIndex(max(0, idx))
+            format_combo.setCurrentIndex(_FORMAT_INDEX.get(fmt, 0))
             width_spin.setValue(int(cfg.get("max_width", width_spin.value())))
             quality_spin.setValue(int(cfg.get("quality", quality_spin.value())))
             subdir_edit.setText(str(cfg.get("subdir", profile)))
@@ -6361,10 +7409,10 @@ class PresetTab(QWidget):
         export_profiles = {}
         for profile, widgets in self.profile_widgets.items():
             export_profiles[profile] = {
-                "format": str(widgets["format"].currentText()),
-                "max_width": int(widgets["max_width"].value()),
-                "quality": int(widgets["quality"].value()),
-                "subdir": str(widgets["subdir"].text().strip() or profile),
+                "format": str(widgets.format.currentText()),
+                "max_width": int(widgets.max_width.value()),
+                "quality": int(widgets.quality.value()),
+                "subdir": str(widgets.subdir.text().strip() or profile),
             }
 
         return {
@@ -6393,28 +7441,42 @@ class PresetTab(QWidget):
     @staticmethod
     def _deep_merge(base: dict, override: dict) -> dict:
         merged = dict(base)
-        for key, value in override.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = PresetTab._deep_merge(merged[key], value)
-            else:
-                merged[key] = value
+        if not override:
+            return merged
+        # Walk nested overrides with an explicit stack; only the dicts that
+        # actually receive overrides are copied, the rest stay shared.
+        pending = [(merged, override)]
+        while pending:
+            target, source = pending.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current = dict(current)
+                    target[key] = current
+                    pending.append((current, value))
+                else:
+                    target[key] = value
         return merged
 
-    @staticmethod
-    def _linked_projects_summary(preset) -> str:
-        names = sorted([item.name for item in (preset.projects or [])])
-        if not names:
-            return "Aucun projet"
-        if len(names) <= 2:
-            return ", ".join(names)
-        return f"{len(names)} projets: {', '.join(names[:2])}..."
-
-    @staticmethod
-    def _linked_projects_tooltip(preset) -> str:
-        names = sorted([item.name for item in (preset.projects or [])])
+    def _linked_projects(self, preset) -> tuple[str, str]:
+        """Return the card summary and the full tooltip for a preset's projects."""
+        projects = preset.projects or ()
+        key = (int(preset.id), len(projects))
+        cached = self._linked_cache.get(key)
+        if cached is not None:
+            return cached
+        names = [item.name for item in projects]
+        names.sort()
         if not names:
-            return "Projets associes: aucun"
-        return "Projets associes: " + ", ".join(names)
+            labels = ("Aucun projet", "Projets associes: aucun")
+        else:
+            tooltip = "Projets associes: " + ", ".join(names)
+            if len(names) <= 2:
+                labels = (", ".join(names), tooltip)
+            else:
+                labels = (f"{len(names)} projets: {', '.join(names[:2])}...", tooltip)
+        self._linked_cache[key] = labels
+        return labels
 
 class SettingsTab(QWidget):
     def __init__(
@@ -6429,6 +7491,8 @@ class SettingsTab(QWidget):
         self.is_busy = is_busy
         self.on_migration_completed = on_migration_completed
         self.on_theme_changed = on_theme_changed
+        self._storage_root_dialog: QFileDialog | None = None
+        self._validation_box: QMessageBox | None = None
 
         layout = QVBoxLayout(self)
 
@@ -6505,11 +7569,14 @@ class SettingsTab(QWidget):
         self.copyright_notice_edit.setText(str(profile.get("copyright_notice", "") or ""))
 
     def _pick_storage_root(self) -> None:
-        directory = QFileDialog.getExistingDirectory(self, "Choisir dossier global de stockage")
-        if directory:
-            self.storage_root_edit.setText(directory)
+        if self._storage_root_dialog is None:
+            self._storage_root_dialog = _new_directory_dialog(self, "Choisir dossier global de stockage")
+        if self._storage_root_dialog.exec() and self._storage_root_dialog.selectedFiles():
+            self.storage_root_edit.setText(self._storage_root_dialog.selectedFiles()[0])
 
     def _pick_accent_color(self) -> None:
+        from PySide6.QtWidgets import QColorDialog
+
         current = QColor(normalize_accent_color(self.accent_color_edit.text().strip()))
         chosen = QColorDialog.getColor(current, self, "Choisir couleur d'accent")
         if chosen.isValid():
@@ -6540,10 +7607,10 @@ class SettingsTab(QWidget):
     def _apply_storage_root(self) -> None:
         new_root = self.storage_root_edit.text().strip()
         if not new_root:
-            QMessageBox.warning(self, "Validation", "Le dossier global est obligatoire.")
+            _show_warning(self, "Validation", "Le dossier global est obligatoire.")
             return
         if self.is_busy():
-            QMessageBox.warning(self, "Operation en cours", "Attends la fin des imports/exports avant migration.")
+            _show_warning(self, "Operation en cours", "Attends la fin des imports/exports avant migration.")
             return
 
         target_data_dir = compute_app_data_dir_from_root(new_root)
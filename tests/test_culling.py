@@ -66,6 +66,10 @@ class CullingServiceTests(unittest.TestCase):
             self.assertEqual(len(rejected), 1)
             self.assertTrue(rejected[0].is_rejected)
 
+            first_page = service.list_assets(project.id, limit=1)
+            second_page = service.list_assets(project.id, offset=1, limit=1)
+            self.assertEqual([item.id for item in first_page + second_page], [item.id for item in all_items])
+
             rated = service.list_assets(project.id, rejected_mode="all", min_rating=3)
             self.assertEqual(len(rated), 1)
             self.assertEqual(rated[0].rating, 4)
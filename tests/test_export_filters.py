@@ -16,6 +16,11 @@ class ExportFilterTests(unittest.TestCase):
         self.assertEqual(ExportService._normalize_opacity_percentage(70), 70)
         self.assertEqual(ExportService._normalize_opacity_percentage(180), 71)
         self.assertEqual(ExportService._normalize_opacity_percentage(255), 100)
+        self.assertEqual(ExportService._normalize_opacity_percentage(42.9), 42)
+        self.assertEqual(ExportService._normalize_opacity_percentage("55"), 55)
+        self.assertEqual(ExportService._normalize_opacity_percentage(-3), 0)
+        self.assertEqual(ExportService._normalize_opacity_percentage(float("nan")), 70)
+        self.assertEqual(ExportService._normalize_opacity_percentage(None), 70)
 
     def test_export_respects_min_rating(self):
         with tempfile.TemporaryDirectory() as td:
@@ -157,6 +157,93 @@ class ProjectCustomRootTests(unittest.TestCase):
 
             engine.dispose()
 
+    def test_count_by_status_groups_projects(self):
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            db_path = base / 'db.sqlite'
+            default_projects = base / 'default_projects'
+            default_projects.mkdir(parents=True, exist_ok=True)
+
+            engine = create_sqlite_engine(db_path)
+            init_db(engine)
+            session_factory = create_session_factory(engine)
+
+            project_service = ProjectService(
+                session_factory=session_factory,
+                paths=AppPaths(data_dir=base, db_path=db_path, projects_dir=default_projects),
+            )
+            self.assertEqual(project_service.count_by_status(), {})
+
+            first = project_service.create_project(name='Client F', shoot_date=date(2026, 2, 13))
+            project_service.create_project(name='Client G', shoot_date=date(2026, 2, 14))
+            project_service.update_project_status(first.id, 'importe')
+
+            self.assertEqual(project_service.count_by_status(), {'a_importer': 1, 'importe': 1})
+
+            engine.dispose()
+
+    def test_list_recent_projects_is_bounded_and_newest_first(self):
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            db_path = base / 'db.sqlite'
+            default_projects = base / 'default_projects'
+            default_projects.mkdir(parents=True, exist_ok=True)
+
+            engine = create_sqlite_engine(db_path)
+            init_db(engine)
+            session_factory = create_session_factory(engine)
+
+            project_service = ProjectService(
+                session_factory=session_factory,
+                paths=AppPaths(data_dir=base, db_path=db_path, projects_dir=default_projects),
+            )
+            for index in range(4):
+                project_service.create_project(name=f'Client R{index}', shoot_date=date(2026, 3, 1 + index))
+
+            recent = project_service.list_recent_projects(limit=2)
+            expected = [project.id for project in project_service.list_projects()[:2]]
+            self.assertEqual([project.id for project in recent], expected)
+            self.assertEqual(project_service.list_recent_projects(limit=0), [])
+
+            engine.dispose()
+
+    def test_list_projects_pages_and_filters_by_name(self):
+        with tempfile.TemporaryDirectory() as td:
+            base = Path(td)
+            db_path = base / 'db.sqlite'
+            default_projects = base / 'default_projects'
+            default_projects.mkdir(parents=True, exist_ok=True)
+
+            engine = create_sqlite_engine(db_path)
+            init_db(engine)
+            session_factory = create_session_factory(engine)
+
+            project_service = ProjectService(
+                session_factory=session_factory,
+                paths=AppPaths(data_dir=base, db_path=db_path, projects_dir=default_projects),
+            )
+            for index in range(3):
+                project_service.create_project(name=f'Mariage {index}', shoot_date=date(2026, 4, 1 + index))
+            project_service.create_project(name='Portrait Studio', shoot_date=date(2026, 4, 9))
+
+            all_ids = [project.id for project in project_service.list_projects()]
+            first_page = project_service.list_projects(limit=2)
+            second_page = project_service.list_projects(limit=2, offset=2)
+            self.assertEqual([project.id for project in first_page + second_page], all_ids)
+
+            matches = project_service.list_projects(name_contains='  MARIAGE ')
+            self.assertEqual(len(matches), 3)
+            self.assertTrue(all(project.name.startswith('Mariage') for project in matches))
+            self.assertEqual(len(project_service.list_projects(limit=1, name_contains='mariage')), 1)
+
+            project_service.create_project(name='Mariage_2024', shoot_date=date(2026, 4, 10))
+            project_service.create_project(name='Mariage-2024', shoot_date=date(2026, 4, 11))
+            literal = project_service.list_projects(name_contains='mariage_2024')
+            self.assertEqual([project.name for project in literal], ['Mariage_2024'])
+            self.assertEqual(project_service.list_projects(name_contains='%'), [])
+
+            engine.dispose()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,9 @@
 import unittest
 
-from photohub.services.watermarks import normalize_watermark_config
+from photohub.services.watermarks import (
+    normalize_watermark_config,
+    summarize_watermark_config,
+)
 
 
 class WatermarkSchemaTests(unittest.TestCase):
@@ -42,6 +45,25 @@ class WatermarkSchemaTests(unittest.TestCase):
         self.assertEqual(cfg["logo"]["angle_deg"], -180.0)
         self.assertEqual(cfg["logo"]["opacity"], 100)
 
+    def test_summary_reads_flags_without_full_normalization(self):
+        self.assertEqual(summarize_watermark_config(None), "Desactive")
+        self.assertEqual(summarize_watermark_config({"watermark": {"enabled": False}}), "Desactive")
+        self.assertEqual(
+            summarize_watermark_config({"watermark": {"enabled": True, "text": "LEGACY"}}),
+            "texte on | logo off | ordre: logo>text",
+        )
+        self.assertEqual(
+            summarize_watermark_config(
+                {
+                    "enabled": True,
+                    "text": {"enabled": False, "color_hex": "not-a-color"},
+                    "logo": {"enabled": True},
+                    "render_order": ["TEXT", "bogus"],
+                }
+            ),
+            "texte off | logo on | ordre: text>logo",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+from datetime import date
 
-from photohub.services.watermarks import render_template
+from photohub.services.watermarks import build_watermark_context, render_template
 
 
 class WatermarkTemplateTests(unittest.TestCase):
@@ -25,6 +26,25 @@ class WatermarkTemplateTests(unittest.TestCase):
         )
         self.assertEqual(rendered, "Shoot A 2026-02-14")
 
+    def test_context_keeps_project_fields_when_client_lookup_fails(self):
+        class DetachedProject:
+            name = "Shoot A"
+            shoot_date = date(2026, 2, 14)
+
+            @property
+            def client(self):
+                raise RuntimeError("detached")
+
+        context = build_watermark_context(
+            project=DetachedProject(),
+            preset_name="Web",
+            min_rating=0,
+            studio_profile=None,
+        )
+        self.assertEqual(context["client_name"], "")
+        self.assertEqual(context["project_name"], "Shoot A")
+        self.assertEqual(context["shoot_date"], "2026-02-14")
+
 
 if __name__ == "__main__":
     unittest.main()